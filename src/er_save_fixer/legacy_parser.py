@@ -9,6 +9,11 @@ import struct
 from dataclasses import dataclass
 from enum import IntEnum
 
+from .parser._structs import I32, U16, U32, U64, F32x3, F32x4
+
+# BaseVersion fix: base_version_copy, base_version, is_latest_version
+_BASE_VER_STRUCT = struct.Struct("<iii")
+
 
 class HorseState(IntEnum):
     """Torrent/Horse states"""
@@ -28,11 +33,11 @@ class FloatVector3:
 
     @classmethod
     def from_bytes(cls, data: bytes, offset: int):
-        x, y, z = struct.unpack("<fff", data[offset : offset + 12])
+        x, y, z = F32x3.unpack(data[offset : offset + 12])
         return cls(x, y, z)
 
     def to_bytes(self) -> bytes:
-        return struct.pack("<fff", self.x, self.y, self.z)
+        return F32x3.pack(self.x, self.y, self.z)
 
     def __str__(self):
         return f"({self.x:.2f}, {self.y:.2f}, {self.z:.2f})"
@@ -49,11 +54,11 @@ class FloatVector4:
 
     @classmethod
     def from_bytes(cls, data: bytes, offset: int):
-        x, y, z, w = struct.unpack("<ffff", data[offset : offset + 16])
+        x, y, z, w = F32x4.unpack(data[offset : offset + 16])
         return cls(x, y, z, w)
 
     def to_bytes(self) -> bytes:
-        return struct.pack("<ffff", self.x, self.y, self.z, self.w)
+        return F32x4.pack(self.x, self.y, self.z, self.w)
 
 
 @dataclass
@@ -102,16 +107,16 @@ class WorldAreaTime:
 
     @classmethod
     def from_bytes(cls, data: bytes, offset: int):
-        hour = struct.unpack("<I", data[offset : offset + 4])[0]
-        minute = struct.unpack("<I", data[offset + 4 : offset + 8])[0]
-        seconds = struct.unpack("<I", data[offset + 8 : offset + 12])[0]
+        hour = U32.unpack(data[offset : offset + 4])[0]
+        minute = U32.unpack(data[offset + 4 : offset + 8])[0]
+        seconds = U32.unpack(data[offset + 8 : offset + 12])[0]
         return cls(hour, minute, seconds)
 
     def to_bytes(self) -> bytes:
         result = bytearray()
-        result.extend(struct.pack("<I", self.hour))
-        result.extend(struct.pack("<I", self.minute))
-        result.extend(struct.pack("<I", self.seconds))
+        result.extend(U32.pack(self.hour))
+        result.extend(U32.pack(self.minute))
+        result.extend(U32.pack(self.seconds))
         return bytes(result)
 
     def is_zero(self) -> bool:
@@ -146,16 +151,16 @@ class WorldAreaWeather:
 
     @classmethod
     def from_bytes(cls, data: bytes, offset: int):
-        area_id = struct.unpack("<H", data[offset : offset + 2])[0]
-        weather_type = struct.unpack("<H", data[offset + 2 : offset + 4])[0]
-        timer = struct.unpack("<I", data[offset + 4 : offset + 8])[0]
+        area_id = U16.unpack(data[offset : offset + 2])[0]
+        weather_type = U16.unpack(data[offset + 2 : offset + 4])[0]
+        timer = U32.unpack(data[offset + 4 : offset + 8])[0]
         return cls(area_id, weather_type, timer)
 
     def to_bytes(self) -> bytes:
         result = bytearray()
-        result.extend(struct.pack("<H", self.area_id))
-        result.extend(struct.pack("<H", self.weather_type))
-        result.extend(struct.pack("<I", self.timer))
+        result.extend(U16.pack(self.area_id))
+        result.extend(U16.pack(self.weather_type))
+        result.extend(U32.pack(self.timer))
         result.extend(bytes(4))  # Padding to 0xC
         return bytes(result)
 
@@ -181,8 +186,8 @@ class RideGameData:
         coords = FloatVector3.from_bytes(data, offset)
         map_id = MapID.from_bytes(data, offset + 12)
         angle = FloatVector4.from_bytes(data, offset + 16)
-        hp = struct.unpack("<I", data[offset + 32 : offset + 36])[0]
-        state = HorseState(struct.unpack("<I", data[offset + 36 : offset + 40])[0])
+        hp = U32.unpack(data[offset + 32 : offset + 36])[0]
+        state = HorseState(U32.unpack(data[offset + 36 : offset + 40])[0])
         return cls(coords, map_id, angle, hp, state)
 
     def to_bytes(self) -> bytes:
@@ -190,8 +195,8 @@ class RideGameData:
         result.extend(self.coordinates.to_bytes())
         result.extend(self.map_id.to_bytes())
         result.extend(self.angle.to_bytes())
-        result.extend(struct.pack("<I", self.hp))
-        result.extend(struct.pack("<I", int(self.state)))
+        result.extend(U32.pack(self.hp))
+        result.extend(U32.pack(int(self.state)))
         return bytes(result)
 
     def has_bug(self) -> bool:
@@ -266,7 +271,7 @@ class CharacterSlot:
         """Parse through the structure to find exact offsets (minimal work for speed)"""
         offset = self.data_start
 
-        self.version = struct.unpack("<I", self.data[offset : offset + 4])[0]
+        self.version = U32.unpack(self.data[offset : offset + 4])[0]
         offset += 4
 
         self.map_id = MapID.from_bytes(self.data, offset)
@@ -281,7 +286,7 @@ class CharacterSlot:
 
         # Parse GaitemHandleMap to find player_data_offset (needed for get_character_name)
         for _ in range(self.gaitem_count):
-            gaitem_handle = struct.unpack("<I", self.data[offset : offset + 4])[0]
+            gaitem_handle = U32.unpack(self.data[offset : offset + 4])[0]
             offset += 4
             offset += 4
 
@@ -333,11 +338,9 @@ class CharacterSlot:
 
         for offset in range(weather_search_start, weather_search_end, 1):
             try:
-                area_id = struct.unpack("<H", self.data[offset : offset + 2])[0]
-                weather_type = struct.unpack("<H", self.data[offset + 2 : offset + 4])[
-                    0
-                ]
-                timer = struct.unpack("<I", self.data[offset + 4 : offset + 8])[0]
+                area_id = U16.unpack(self.data[offset : offset + 2])[0]
+                weather_type = U16.unpack(self.data[offset + 2 : offset + 4])[0]
+                timer = U32.unpack(self.data[offset + 4 : offset + 8])[0]
 
                 if area_id > 255:
                     continue
@@ -514,8 +517,8 @@ class CharacterSlot:
                 continue
 
             try:
-                hp = struct.unpack("<I", self.data[offset + 32 : offset + 36])[0]
-                state = struct.unpack("<I", self.data[offset + 36 : offset + 40])[0]
+                hp = U32.unpack(self.data[offset + 32 : offset + 36])[0]
+                state = U32.unpack(self.data[offset + 36 : offset + 40])[0]
 
                 if hp > 0 and hp < 5000 and state == 1:
                     return offset
@@ -723,7 +726,7 @@ class CharacterSlot:
             return None
         try:
             offset = self.data_start + self.STEAM_ID_OFFSET
-            return struct.unpack("<Q", self.data[offset : offset + 8])[0]
+            return U64.unpack(self.data[offset : offset + 8])[0]
         except Exception:
             return None
 
@@ -733,7 +736,7 @@ class CharacterSlot:
         if self.STEAM_ID_OFFSET == 0:
             return
         offset = self.data_start + self.STEAM_ID_OFFSET
-        struct.pack_into("<Q", self.data, offset, steam_id)
+        U64.pack_into(self.data, offset, steam_id)
 
     def has_corruption(self) -> tuple[bool, list[str]]:
         """Check if character has known corruption patterns"""
@@ -792,7 +795,7 @@ class EldenRingSaveFile:
                 )
                 data_start = slot_offset + self.CHECKSUM_SIZE
 
-                version = struct.unpack("<I", self.data[data_start : data_start + 4])[0]
+                version = U32.unpack(self.data[data_start : data_start + 4])[0]
                 if version == 0:
                     self.characters.append(None)
                     continue
@@ -857,7 +860,7 @@ class EldenRingSaveFile:
         """Get SteamId from USER_DATA_10 (Common data)"""
         try:
             offset = self.USERDATA_10_START + self.STEAM_ID_OFFSET_USERDATA
-            return struct.unpack("<Q", self.data[offset : offset + 8])[0]
+            return U64.unpack(self.data[offset : offset + 8])[0]
         except Exception:
             return None
 
@@ -871,9 +874,7 @@ class EldenRingSaveFile:
                 slot_index * profile_data_size
             )
             seconds_offset = profile_data_start + 0x26
-            value = struct.unpack("<i", self.data[seconds_offset : seconds_offset + 4])[
-                0
-            ]
+            value = I32.unpack(self.data[seconds_offset : seconds_offset + 4])[0]
             return value
         except Exception:
             return None
@@ -920,15 +921,13 @@ class EldenRingSaveFile:
             base_version_offset = (
                 slot.data_start + slot.WORLD_AREA_WEATHER_OFFSET + 0x1C
             )
-            current_base_version = struct.unpack(
-                "<i", slot.data[base_version_offset : base_version_offset + 4]
-            )[0]
+            current_base_version = I32.unpack_from(slot.data, base_version_offset)[0]
 
             if current_base_version == 0:
                 game_version = 150
-                struct.pack_into("<i", slot.data, base_version_offset - 4, game_version)
-                struct.pack_into("<i", slot.data, base_version_offset, game_version)
-                struct.pack_into("<i", slot.data, base_version_offset + 4, 1)
+                _BASE_VER_STRUCT.pack_into(
+                    slot.data, base_version_offset - 4, game_version, game_version, 1
+                )
                 fixes_applied.append(f"BaseVersion: 0 -> {game_version}")
 
         return (len(fixes_applied) > 0, fixes_applied)
@@ -0,0 +1,26 @@
+"""
+Elden Ring Save Parser - Precompiled Struct Formats
+
+Shared little-endian struct.Struct instances for the scalar and vector
+fields used throughout the save file. Using a precompiled Struct skips the
+per-call format string lookup that struct.pack()/struct.unpack() perform.
+"""
+
+from __future__ import annotations
+
+from struct import Struct
+
+# Scalars
+BOOL = Struct("<?")
+U8 = Struct("<B")
+U16 = Struct("<H")
+I32 = Struct("<i")
+U32 = Struct("<I")
+F32 = Struct("<f")
+I64 = Struct("<q")
+U64 = Struct("<Q")
+
+# Vectors / pairs
+F32x3 = Struct("<fff")
+F32x4 = Struct("<ffff")
+U32x2 = Struct("<II")
@@ -17,8 +17,36 @@ from .er_types import Util
 # PLAYER GAME DATA - Complete character stats and attributes
 # ============================================================================
 
+# PlayerGameData is read as one 0x1B0 buffer and decoded in three blocks
+# unk0x0 .. unk0x90 (0x00-0x93)
+_PGD_HEAD = struct.Struct("<37I")
+# character_name, terminator, character creation bytes, unk0xc0, online
+# settings, unk0xdd, great_rune_on, unk0xf8, flask counts, unk0xfb
+# (0x94-0x10F)
+_PGD_MID = struct.Struct("<32sH10B24s?BB??26s?BBB21s")
+_PGD_MID_OFFSET = 0x94
+# password and 5 group passwords, each followed by its u16 terminator
+# (0x110-0x17B), then unk0x17c padding up to 0x1B0
+_PGD_PASSWORD = struct.Struct("<16sH")
+_PGD_PASSWORDS_OFFSET = 0x110
+_PGD_GROUP_PASSWORD_COUNT = 5
+_PGD_PADDING_OFFSET = 0x17C
+_PGD_SIZE = 0x1B0
 
-@dataclass
+
+def _list_item_property(list_name: str, index: int) -> property:
+    """Property reading and writing one element of a list field"""
+
+    def fget(self):
+        return getattr(self, list_name)[index]
+
+    def fset(self, value):
+        getattr(self, list_name)[index] = value
+
+    return property(fget, fset, doc=f"{list_name}[{index}]")
+
+
+@dataclass(slots=True)
 class PlayerGameData:
     """
     Complete player/character data structure (0x1B0 = 432 bytes)
@@ -87,7 +115,7 @@ class PlayerGameData:
     unk0xbd: int = 0
     additional_talisman_slot_count: int = 0
     summon_spirit_level: int = 0
-    unk0xc0: bytes = field(default_factory=lambda: b"\x00" * 0x18)
+    unk0xc0: bytes = bytes(0x18)
 
     # Online settings (0xD8-0xF7)
     furl_calling_finger_on: bool = False
@@ -95,31 +123,35 @@ class PlayerGameData:
     matchmaking_weapon_level: int = 0
     white_cipher_ring_on: bool = False
     blue_cipher_ring_on: bool = False
-    unk0xdd: bytes = field(default_factory=lambda: b"\x00" * 0x1A)
+    unk0xdd: bytes = bytes(0x1A)
     great_rune_on: bool = False
     unk0xf8: int = 0
 
     # Flask counts (0xF9-0xFA)
     max_crimson_flask_count: int = 0
     max_cerulean_flask_count: int = 0
-    unk0xfb: bytes = field(default_factory=lambda: b"\x00" * 0x15)
+    unk0xfb: bytes = bytes(0x15)
 
     # Passwords (0x110-0x17B) - UTF-16LE, 8 chars max each
     password: str = ""
     password_terminator: int = 0
-    group_password1: str = ""
-    group_password1_terminator: int = 0
-    group_password2: str = ""
-    group_password2_terminator: int = 0
-    group_password3: str = ""
-    group_password3_terminator: int = 0
-    group_password4: str = ""
-    group_password4_terminator: int = 0
-    group_password5: str = ""
-    group_password5_terminator: int = 0
+    group_passwords: list[str] = field(default_factory=lambda: [""] * 5)
+    group_password_terminators: list[int] = field(default_factory=lambda: [0] * 5)
+
+    # Per-password accessors kept from when each was its own field
+    group_password1 = _list_item_property("group_passwords", 0)
+    group_password2 = _list_item_property("group_passwords", 1)
+    group_password3 = _list_item_property("group_passwords", 2)
+    group_password4 = _list_item_property("group_passwords", 3)
+    group_password5 = _list_item_property("group_passwords", 4)
+    group_password1_terminator = _list_item_property("group_password_terminators", 0)
+    group_password2_terminator = _list_item_property("group_password_terminators", 1)
+    group_password3_terminator = _list_item_property("group_password_terminators", 2)
+    group_password4_terminator = _list_item_property("group_password_terminators", 3)
+    group_password5_terminator = _list_item_property("group_password_terminators", 4)
 
     # Padding (0x17C-0x1AF)
-    unk0x17c: bytes = field(default_factory=lambda: b"\x00" * 0x34)
+    unk0x17c: bytes = bytes(0x34)
 
     @classmethod
     def read(cls, f: BytesIO) -> PlayerGameData:
@@ -128,199 +160,167 @@ class PlayerGameData:
         Returns:
             PlayerGameData instance with all fields populated
         """
-        obj = cls()
-
-        # Health, FP, Stamina
-        obj.unk0x0 = struct.unpack("<I", f.read(4))[0]
-        obj.unk0x4 = struct.unpack("<I", f.read(4))[0]
-        obj.hp = struct.unpack("<I", f.read(4))[0]
-        obj.max_hp = struct.unpack("<I", f.read(4))[0]
-        obj.base_max_hp = struct.unpack("<I", f.read(4))[0]
-        obj.fp = struct.unpack("<I", f.read(4))[0]
-        obj.max_fp = struct.unpack("<I", f.read(4))[0]
-        obj.base_max_fp = struct.unpack("<I", f.read(4))[0]
-        obj.unk0x20 = struct.unpack("<I", f.read(4))[0]
-        obj.sp = struct.unpack("<I", f.read(4))[0]
-        obj.max_sp = struct.unpack("<I", f.read(4))[0]
-        obj.base_max_sp = struct.unpack("<I", f.read(4))[0]
-        obj.unk0x30 = struct.unpack("<I", f.read(4))[0]
-
-        # Attributes
-        obj.vigor = struct.unpack("<I", f.read(4))[0]
-        obj.mind = struct.unpack("<I", f.read(4))[0]
-        obj.endurance = struct.unpack("<I", f.read(4))[0]
-        obj.strength = struct.unpack("<I", f.read(4))[0]
-        obj.dexterity = struct.unpack("<I", f.read(4))[0]
-        obj.intelligence = struct.unpack("<I", f.read(4))[0]
-        obj.faith = struct.unpack("<I", f.read(4))[0]
-        obj.arcane = struct.unpack("<I", f.read(4))[0]
-        obj.unk0x54 = struct.unpack("<I", f.read(4))[0]
-        obj.unk0x58 = struct.unpack("<I", f.read(4))[0]
-        obj.unk0x5c = struct.unpack("<I", f.read(4))[0]
-
-        # Level and Runes
-        obj.level = struct.unpack("<I", f.read(4))[0]
-        obj.runes = struct.unpack("<I", f.read(4))[0]
-        obj.runes_memory = struct.unpack("<I", f.read(4))[0]
-        obj.unk0x6c = struct.unpack("<I", f.read(4))[0]
-
-        # Status buildups
-        obj.poison_buildup = struct.unpack("<I", f.read(4))[0]
-        obj.rot_buildup = struct.unpack("<I", f.read(4))[0]
-        obj.bleed_buildup = struct.unpack("<I", f.read(4))[0]
-        obj.death_buildup = struct.unpack("<I", f.read(4))[0]
-        obj.frost_buildup = struct.unpack("<I", f.read(4))[0]
-        obj.sleep_buildup = struct.unpack("<I", f.read(4))[0]
-        obj.madness_buildup = struct.unpack("<I", f.read(4))[0]
-        obj.unk0x8c = struct.unpack("<I", f.read(4))[0]
-        obj.unk0x90 = struct.unpack("<I", f.read(4))[0]
-
-        # Character name (UTF-16LE, 16 chars)
-        obj.character_name = Util.read_wstring(f, 16)
-        obj.terminator = struct.unpack("<H", f.read(2))[0]
-
-        # Character creation
-        obj.gender = struct.unpack("<B", f.read(1))[0]
-        obj.archetype = struct.unpack("<B", f.read(1))[0]
-        obj.unk0xb8 = struct.unpack("<B", f.read(1))[0]
-        obj.unk0xb9 = struct.unpack("<B", f.read(1))[0]
-        obj.voice_type = struct.unpack("<B", f.read(1))[0]
-        obj.gift = struct.unpack("<B", f.read(1))[0]
-        obj.unk0xbc = struct.unpack("<B", f.read(1))[0]
-        obj.unk0xbd = struct.unpack("<B", f.read(1))[0]
-        obj.additional_talisman_slot_count = struct.unpack("<B", f.read(1))[0]
-        obj.summon_spirit_level = struct.unpack("<B", f.read(1))[0]
-        obj.unk0xc0 = f.read(0x18)
-
-        # Online settings
-        obj.furl_calling_finger_on = struct.unpack("<?", f.read(1))[0]
-        obj.unk0xd9 = struct.unpack("<B", f.read(1))[0]
-        obj.matchmaking_weapon_level = struct.unpack("<B", f.read(1))[0]
-        obj.white_cipher_ring_on = struct.unpack("<?", f.read(1))[0]
-        obj.blue_cipher_ring_on = struct.unpack("<?", f.read(1))[0]
-        obj.unk0xdd = f.read(0x1A)
-        obj.great_rune_on = struct.unpack("<?", f.read(1))[0]
-        obj.unk0xf8 = struct.unpack("<B", f.read(1))[0]
-
-        # Flask counts
-        obj.max_crimson_flask_count = struct.unpack("<B", f.read(1))[0]
-        obj.max_cerulean_flask_count = struct.unpack("<B", f.read(1))[0]
-        obj.unk0xfb = f.read(0x15)
-
-        # Passwords (UTF-16LE, 8 chars each)
-        obj.password = Util.read_wstring(f, 8)
-        obj.password_terminator = struct.unpack("<H", f.read(2))[0]
-        obj.group_password1 = Util.read_wstring(f, 8)
-        obj.group_password1_terminator = struct.unpack("<H", f.read(2))[0]
-        obj.group_password2 = Util.read_wstring(f, 8)
-        obj.group_password2_terminator = struct.unpack("<H", f.read(2))[0]
-        obj.group_password3 = Util.read_wstring(f, 8)
-        obj.group_password3_terminator = struct.unpack("<H", f.read(2))[0]
-        obj.group_password4 = Util.read_wstring(f, 8)
-        obj.group_password4_terminator = struct.unpack("<H", f.read(2))[0]
-        obj.group_password5 = Util.read_wstring(f, 8)
-        obj.group_password5_terminator = struct.unpack("<H", f.read(2))[0]
+        return cls.from_bytes(f.read(_PGD_SIZE))[0]
+
+    @classmethod
+    def from_bytes(
+        cls, buf: bytes | memoryview, offset: int = 0
+    ) -> tuple[PlayerGameData, int]:
+        """
+        Decode PlayerGameData directly from a buffer (432 bytes total).
+
+        Args:
+            buf: Buffer holding the record, e.g. the whole save file
+            offset: Position of the record in buf
+
+        Returns:
+            (PlayerGameData instance, offset just past the record)
+        """
+        # Health, FP, Stamina, attributes, level/runes and status buildups:
+        # 37 u32s that are also the first 37 fields, in order
+        obj = cls(*_PGD_HEAD.unpack_from(buf, offset))
+
+        # Character name (UTF-16LE, 16 chars) through flask counts
+        (
+            name,
+            obj.terminator,
+            obj.gender,
+            obj.archetype,
+            obj.unk0xb8,
+            obj.unk0xb9,
+            obj.voice_type,
+            obj.gift,
+            obj.unk0xbc,
+            obj.unk0xbd,
+            obj.additional_talisman_slot_count,
+            obj.summon_spirit_level,
+            obj.unk0xc0,
+            obj.furl_calling_finger_on,
+            obj.unk0xd9,
+            obj.matchmaking_weapon_level,
+            obj.white_cipher_ring_on,
+            obj.blue_cipher_ring_on,
+            obj.unk0xdd,
+            obj.great_rune_on,
+            obj.unk0xf8,
+            obj.max_crimson_flask_count,
+            obj.max_cerulean_flask_count,
+            obj.unk0xfb,
+        ) = _PGD_MID.unpack_from(buf, offset + _PGD_MID_OFFSET)
+        obj.character_name = Util.decode_wstring(name)
+
+        # Passwords (UTF-16LE, 8 chars each), each with a u16 terminator
+        passwords = _PGD_PASSWORD.iter_unpack(
+            buf[offset + _PGD_PASSWORDS_OFFSET : offset + _PGD_PADDING_OFFSET]
+        )
+        password, obj.password_terminator = next(passwords)
+        obj.password = Util.decode_wstring(password)
+        obj.group_passwords = []
+        obj.group_password_terminators = []
+        for group_password, terminator in passwords:
+            obj.group_passwords.append(Util.decode_wstring(group_password))
+            obj.group_password_terminators.append(terminator)
 
         # Padding
-        obj.unk0x17c = f.read(0x34)
+        obj.unk0x17c = bytes(buf[offset + _PGD_PADDING_OFFSET : offset + _PGD_SIZE])
 
-        return obj
+        return obj, offset + _PGD_SIZE
 
     def write(self, f: BytesIO):
         """Write PlayerGameData to stream (432 bytes total)"""
-        # Health, FP, Stamina
-        f.write(struct.pack("<I", self.unk0x0))
-        f.write(struct.pack("<I", self.unk0x4))
-        f.write(struct.pack("<I", self.hp))
-        f.write(struct.pack("<I", self.max_hp))
-        f.write(struct.pack("<I", self.base_max_hp))
-        f.write(struct.pack("<I", self.fp))
-        f.write(struct.pack("<I", self.max_fp))
-        f.write(struct.pack("<I", self.base_max_fp))
-        f.write(struct.pack("<I", self.unk0x20))
-        f.write(struct.pack("<I", self.sp))
-        f.write(struct.pack("<I", self.max_sp))
-        f.write(struct.pack("<I", self.base_max_sp))
-        f.write(struct.pack("<I", self.unk0x30))
-
-        # Attributes
-        f.write(struct.pack("<I", self.vigor))
-        f.write(struct.pack("<I", self.mind))
-        f.write(struct.pack("<I", self.endurance))
-        f.write(struct.pack("<I", self.strength))
-        f.write(struct.pack("<I", self.dexterity))
-        f.write(struct.pack("<I", self.intelligence))
-        f.write(struct.pack("<I", self.faith))
-        f.write(struct.pack("<I", self.arcane))
-        f.write(struct.pack("<I", self.unk0x54))
-        f.write(struct.pack("<I", self.unk0x58))
-        f.write(struct.pack("<I", self.unk0x5c))
-
-        # Level and Runes
-        f.write(struct.pack("<I", self.level))
-        f.write(struct.pack("<I", self.runes))
-        f.write(struct.pack("<I", self.runes_memory))
-        f.write(struct.pack("<I", self.unk0x6c))
-
-        # Status buildups
-        f.write(struct.pack("<I", self.poison_buildup))
-        f.write(struct.pack("<I", self.rot_buildup))
-        f.write(struct.pack("<I", self.bleed_buildup))
-        f.write(struct.pack("<I", self.death_buildup))
-        f.write(struct.pack("<I", self.frost_buildup))
-        f.write(struct.pack("<I", self.sleep_buildup))
-        f.write(struct.pack("<I", self.madness_buildup))
-        f.write(struct.pack("<I", self.unk0x8c))
-        f.write(struct.pack("<I", self.unk0x90))
-
-        # Character name
-        Util.write_wstring(f, self.character_name, 16)
-        f.write(struct.pack("<H", self.terminator))
-
-        # Character creation
-        f.write(struct.pack("<B", self.gender))
-        f.write(struct.pack("<B", self.archetype))
-        f.write(struct.pack("<B", self.unk0xb8))
-        f.write(struct.pack("<B", self.unk0xb9))
-        f.write(struct.pack("<B", self.voice_type))
-        f.write(struct.pack("<B", self.gift))
-        f.write(struct.pack("<B", self.unk0xbc))
-        f.write(struct.pack("<B", self.unk0xbd))
-        f.write(struct.pack("<B", self.additional_talisman_slot_count))
-        f.write(struct.pack("<B", self.summon_spirit_level))
-        f.write(self.unk0xc0)
-
-        # Online settings
-        f.write(struct.pack("<?", self.furl_calling_finger_on))
-        f.write(struct.pack("<B", self.unk0xd9))
-        f.write(struct.pack("<B", self.matchmaking_weapon_level))
-        f.write(struct.pack("<?", self.white_cipher_ring_on))
-        f.write(struct.pack("<?", self.blue_cipher_ring_on))
-        f.write(self.unk0xdd)
-        f.write(struct.pack("<?", self.great_rune_on))
-        f.write(struct.pack("<B", self.unk0xf8))
-
-        # Flask counts
-        f.write(struct.pack("<B", self.max_crimson_flask_count))
-        f.write(struct.pack("<B", self.max_cerulean_flask_count))
-        f.write(self.unk0xfb)
-
-        # Passwords
-        Util.write_wstring(f, self.password, 8)
-        f.write(struct.pack("<H", self.password_terminator))
-        Util.write_wstring(f, self.group_password1, 8)
-        f.write(struct.pack("<H", self.group_password1_terminator))
-        Util.write_wstring(f, self.group_password2, 8)
-        f.write(struct.pack("<H", self.group_password2_terminator))
-        Util.write_wstring(f, self.group_password3, 8)
-        f.write(struct.pack("<H", self.group_password3_terminator))
-        Util.write_wstring(f, self.group_password4, 8)
-        f.write(struct.pack("<H", self.group_password4_terminator))
-        Util.write_wstring(f, self.group_password5, 8)
-        f.write(struct.pack("<H", self.group_password5_terminator))
+        # Packed in place into one buffer and written with a single call
+        buf = bytearray(_PGD_SIZE)
+        _PGD_HEAD.pack_into(
+            buf,
+            0,
+            self.unk0x0,
+            self.unk0x4,
+            self.hp,
+            self.max_hp,
+            self.base_max_hp,
+            self.fp,
+            self.max_fp,
+            self.base_max_fp,
+            self.unk0x20,
+            self.sp,
+            self.max_sp,
+            self.base_max_sp,
+            self.unk0x30,
+            self.vigor,
+            self.mind,
+            self.endurance,
+            self.strength,
+            self.dexterity,
+            self.intelligence,
+            self.faith,
+            self.arcane,
+            self.unk0x54,
+            self.unk0x58,
+            self.unk0x5c,
+            self.level,
+            self.runes,
+            self.runes_memory,
+            self.unk0x6c,
+            self.poison_buildup,
+            self.rot_buildup,
+            self.bleed_buildup,
+            self.death_buildup,
+            self.frost_buildup,
+            self.sleep_buildup,
+            self.madness_buildup,
+            self.unk0x8c,
+            self.unk0x90,
+        )
 
-        # Padding
-        f.write(self.unk0x17c)
+        # Character name through flask counts
+        _PGD_MID.pack_into(
+            buf,
+            _PGD_MID_OFFSET,
+            Util.encode_wstring(self.character_name, 16),
+            self.terminator,
+            self.gender,
+            self.archetype,
+            self.unk0xb8,
+            self.unk0xb9,
+            self.voice_type,
+            self.gift,
+            self.unk0xbc,
+            self.unk0xbd,
+            self.additional_talisman_slot_count,
+            self.summon_spirit_level,
+            self.unk0xc0,
+            self.furl_calling_finger_on,
+            self.unk0xd9,
+            self.matchmaking_weapon_level,
+            self.white_cipher_ring_on,
+            self.blue_cipher_ring_on,
+            self.unk0xdd,
+            self.great_rune_on,
+            self.unk0xf8,
+            self.max_crimson_flask_count,
+            self.max_cerulean_flask_count,
+            self.unk0xfb,
+        )
+
+        # Passwords and trailing padding
+        offset = _PGD_PASSWORDS_OFFSET
+        _PGD_PASSWORD.pack_into(
+            buf,
+            offset,
+            Util.encode_wstring(self.password, 8),
+            self.password_terminator,
+        )
+        for i in range(_PGD_GROUP_PASSWORD_COUNT):
+            offset += _PGD_PASSWORD.size
+            _PGD_PASSWORD.pack_into(
+                buf,
+                offset,
+                Util.encode_wstring(self.group_passwords[i], 8),
+                self.group_password_terminators[i],
+            )
+        buf[_PGD_PADDING_OFFSET:] = self.unk0x17c
+
+        f.write(buf)
 
 
 # ============================================================================
@@ -328,7 +328,7 @@ class PlayerGameData:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class SPEffect:
     """
     Status effect/buff/debuff (16 bytes per entry, 13 entries total)
@@ -341,22 +341,21 @@ class SPEffect:
     unk0x8: int = 0
     unk0x10: int = 0
 
+    # sp_effect_id, remaining_time, unk0x8, unk0x10
+    _STRUCT = struct.Struct("<ifII")
+
     @classmethod
     def read(cls, f: BytesIO) -> SPEffect:
         """Read SPEffect from stream (16 bytes)"""
-        return cls(
-            sp_effect_id=struct.unpack("<i", f.read(4))[0],
-            remaining_time=struct.unpack("<f", f.read(4))[0],
-            unk0x8=struct.unpack("<I", f.read(4))[0],
-            unk0x10=struct.unpack("<I", f.read(4))[0],
-        )
+        return cls(*cls._STRUCT.unpack(f.read(cls._STRUCT.size)))
 
     def write(self, f: BytesIO):
         """Write SPEffect to stream (16 bytes)"""
-        f.write(struct.pack("<i", self.sp_effect_id))
-        f.write(struct.pack("<f", self.remaining_time))
-        f.write(struct.pack("<I", self.unk0x8))
-        f.write(struct.pack("<I", self.unk0x10))
+        f.write(
+            self._STRUCT.pack(
+                self.sp_effect_id, self.remaining_time, self.unk0x8, self.unk0x10
+            )
+        )
 
     def is_active(self) -> bool:
         """Check if this effect is currently active"""
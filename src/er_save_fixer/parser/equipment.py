@@ -13,12 +13,15 @@ import struct
 from dataclasses import dataclass, field
 from io import BytesIO
 
+from ._structs import U32, U32x2
+from .er_types import PackedRecords, read_fixed_array, read_u32_list, write_u32_list
+
 # ============================================================================
 # BASE CLASS FOR EQUIPMENT SLOTS
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class EquipmentSlots:
     """
     Base class for equipment slot structures (88 bytes).
@@ -30,7 +33,10 @@ class EquipmentSlots:
     - 4 talisman slots
     - 4 unknown fields
 
-    Used by: EquippedItemsEquipIndex, EquippedItemsItemIds, EquippedItemsGaitemHandles
+    Used by: EquippedItemsEquipIndex, EquippedItemsItemIds, EquippedItemsGaitemHandles.
+    The subclasses add no fields, so they are plain subclasses rather than
+    dataclasses of their own and reuse the generated __init__/__repr__/__eq__;
+    each declares an empty __slots__ to keep the base's slotted layout.
     """
 
     left_hand_armament1: int = 0
@@ -56,58 +62,41 @@ class EquipmentSlots:
     talisman4: int = 0
     unk0x54: int = 0
 
+    _STRUCT = struct.Struct("<22I")
+
     @classmethod
     def read(cls, f: BytesIO):
         """Read equipment slots from stream (88 bytes)"""
-        return cls(
-            left_hand_armament1=struct.unpack("<I", f.read(4))[0],
-            right_hand_armament1=struct.unpack("<I", f.read(4))[0],
-            left_hand_armament2=struct.unpack("<I", f.read(4))[0],
-            right_hand_armament2=struct.unpack("<I", f.read(4))[0],
-            left_hand_armament3=struct.unpack("<I", f.read(4))[0],
-            right_hand_armament3=struct.unpack("<I", f.read(4))[0],
-            arrows1=struct.unpack("<I", f.read(4))[0],
-            bolts1=struct.unpack("<I", f.read(4))[0],
-            arrows2=struct.unpack("<I", f.read(4))[0],
-            bolts2=struct.unpack("<I", f.read(4))[0],
-            unk0x28=struct.unpack("<I", f.read(4))[0],
-            unk0x2c=struct.unpack("<I", f.read(4))[0],
-            head=struct.unpack("<I", f.read(4))[0],
-            chest=struct.unpack("<I", f.read(4))[0],
-            arms=struct.unpack("<I", f.read(4))[0],
-            legs=struct.unpack("<I", f.read(4))[0],
-            unk0x40=struct.unpack("<I", f.read(4))[0],
-            talisman1=struct.unpack("<I", f.read(4))[0],
-            talisman2=struct.unpack("<I", f.read(4))[0],
-            talisman3=struct.unpack("<I", f.read(4))[0],
-            talisman4=struct.unpack("<I", f.read(4))[0],
-            unk0x54=struct.unpack("<I", f.read(4))[0],
-        )
+        return cls(*cls._STRUCT.unpack(f.read(cls._STRUCT.size)))
 
     def write(self, f: BytesIO):
         """Write equipment slots to stream (88 bytes)"""
-        f.write(struct.pack("<I", self.left_hand_armament1))
-        f.write(struct.pack("<I", self.right_hand_armament1))
-        f.write(struct.pack("<I", self.left_hand_armament2))
-        f.write(struct.pack("<I", self.right_hand_armament2))
-        f.write(struct.pack("<I", self.left_hand_armament3))
-        f.write(struct.pack("<I", self.right_hand_armament3))
-        f.write(struct.pack("<I", self.arrows1))
-        f.write(struct.pack("<I", self.bolts1))
-        f.write(struct.pack("<I", self.arrows2))
-        f.write(struct.pack("<I", self.bolts2))
-        f.write(struct.pack("<I", self.unk0x28))
-        f.write(struct.pack("<I", self.unk0x2c))
-        f.write(struct.pack("<I", self.head))
-        f.write(struct.pack("<I", self.chest))
-        f.write(struct.pack("<I", self.arms))
-        f.write(struct.pack("<I", self.legs))
-        f.write(struct.pack("<I", self.unk0x40))
-        f.write(struct.pack("<I", self.talisman1))
-        f.write(struct.pack("<I", self.talisman2))
-        f.write(struct.pack("<I", self.talisman3))
-        f.write(struct.pack("<I", self.talisman4))
-        f.write(struct.pack("<I", self.unk0x54))
+        f.write(
+            self._STRUCT.pack(
+                self.left_hand_armament1,
+                self.right_hand_armament1,
+                self.left_hand_armament2,
+                self.right_hand_armament2,
+                self.left_hand_armament3,
+                self.right_hand_armament3,
+                self.arrows1,
+                self.bolts1,
+                self.arrows2,
+                self.bolts2,
+                self.unk0x28,
+                self.unk0x2c,
+                self.head,
+                self.chest,
+                self.arms,
+                self.legs,
+                self.unk0x40,
+                self.talisman1,
+                self.talisman2,
+                self.talisman3,
+                self.talisman4,
+                self.unk0x54,
+            )
+        )
 
 
 # ============================================================================
@@ -115,7 +104,6 @@ class EquipmentSlots:
 # ============================================================================
 
 
-@dataclass
 class EquippedItemsEquipIndex(EquipmentSlots):
     """
     Equipment slot indexes (88 bytes).
@@ -124,10 +112,10 @@ class EquippedItemsEquipIndex(EquipmentSlots):
     Inherits all 22 fields from EquipmentSlots.
     """
 
-    pass
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class ActiveWeaponSlotsAndArmStyle:
     """Active weapon slots and arm style (0x1C = 28 bytes)"""
 
@@ -139,31 +127,28 @@ class ActiveWeaponSlotsAndArmStyle:
     left_bolt_active_slot: int = 0
     right_bolt_active_slot: int = 0
 
+    _STRUCT = struct.Struct("<7I")
+
     @classmethod
     def read(cls, f: BytesIO) -> ActiveWeaponSlotsAndArmStyle:
         """Read ActiveWeaponSlotsAndArmStyle from stream (28 bytes)"""
-        return cls(
-            arm_style=struct.unpack("<I", f.read(4))[0],
-            left_hand_weapon_active_slot=struct.unpack("<I", f.read(4))[0],
-            right_hand_weapon_active_slot=struct.unpack("<I", f.read(4))[0],
-            left_arrow_active_slot=struct.unpack("<I", f.read(4))[0],
-            right_arrow_active_slot=struct.unpack("<I", f.read(4))[0],
-            left_bolt_active_slot=struct.unpack("<I", f.read(4))[0],
-            right_bolt_active_slot=struct.unpack("<I", f.read(4))[0],
-        )
+        return cls(*cls._STRUCT.unpack(f.read(cls._STRUCT.size)))
 
     def write(self, f: BytesIO):
         """Write ActiveWeaponSlotsAndArmStyle to stream (28 bytes)"""
-        f.write(struct.pack("<I", self.arm_style))
-        f.write(struct.pack("<I", self.left_hand_weapon_active_slot))
-        f.write(struct.pack("<I", self.right_hand_weapon_active_slot))
-        f.write(struct.pack("<I", self.left_arrow_active_slot))
-        f.write(struct.pack("<I", self.right_arrow_active_slot))
-        f.write(struct.pack("<I", self.left_bolt_active_slot))
-        f.write(struct.pack("<I", self.right_bolt_active_slot))
+        f.write(
+            self._STRUCT.pack(
+                self.arm_style,
+                self.left_hand_weapon_active_slot,
+                self.right_hand_weapon_active_slot,
+                self.left_arrow_active_slot,
+                self.right_arrow_active_slot,
+                self.left_bolt_active_slot,
+                self.right_bolt_active_slot,
+            )
+        )
 
 
-@dataclass
 class EquippedItemsItemIds(EquipmentSlots):
     """
     Equipment item IDs (88 bytes).
@@ -172,10 +157,9 @@ class EquippedItemsItemIds(EquipmentSlots):
     Inherits all 22 fields from EquipmentSlots.
     """
 
-    pass
+    __slots__ = ()
 
 
-@dataclass
 class EquippedItemsGaitemHandles(EquipmentSlots):
     """
     Equipment Gaitem handles (88 bytes).
@@ -184,12 +168,14 @@ class EquippedItemsGaitemHandles(EquipmentSlots):
     Inherits all 22 fields from EquipmentSlots.
     """
 
-    pass
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InventoryItem:
-    """Single inventory item (12 bytes)"""
+    """Single inventory item (12 bytes, immutable)"""
+
+    _STRUCT = struct.Struct("<III")
 
     gaitem_handle: int = 0
     quantity: int = 0
@@ -198,20 +184,29 @@ class InventoryItem:
     @classmethod
     def read(cls, f: BytesIO) -> InventoryItem:
         """Read InventoryItem from stream (12 bytes)"""
-        return cls(
-            gaitem_handle=struct.unpack("<I", f.read(4))[0],
-            quantity=struct.unpack("<I", f.read(4))[0],
-            acquisition_index=struct.unpack("<I", f.read(4))[0],
-        )
+        return cls(*cls._STRUCT.unpack(f.read(cls._STRUCT.size)))
 
     def write(self, f: BytesIO):
         """Write InventoryItem to stream (12 bytes)"""
-        f.write(struct.pack("<I", self.gaitem_handle))
-        f.write(struct.pack("<I", self.quantity))
-        f.write(struct.pack("<I", self.acquisition_index))
+        f.write(
+            self._STRUCT.pack(self.gaitem_handle, self.quantity, self.acquisition_index)
+        )
+
+
+class InventoryItems(PackedRecords):
+    """
+    Fixed-capacity run of InventoryItem records, decoded on access
 
+    Items are frozen snapshots: assign back a changed copy, e.g.
+    items[i] = replace(items[i], quantity=n).
+    """
+
+    __slots__ = ()
+
+    _RECORD = InventoryItem
 
-@dataclass
+
+@dataclass(slots=True)
 class Inventory:
     """
     Inventory structure (variable size based on capacities)
@@ -222,9 +217,9 @@ class Inventory:
     """
 
     common_item_count: int = 0
-    common_items: list[InventoryItem] = field(default_factory=list)
+    common_items: InventoryItems = field(default_factory=InventoryItems)
     key_item_count: int = 0
-    key_items: list[InventoryItem] = field(default_factory=list)
+    key_items: InventoryItems = field(default_factory=InventoryItems)
     equip_index_counter: int = 0
     acquisition_index_counter: int = 0
 
@@ -244,34 +239,30 @@ class Inventory:
         obj = cls()
 
         # Read common items
-        obj.common_item_count = struct.unpack("<I", f.read(4))[0]
-        obj.common_items = [InventoryItem.read(f) for _ in range(common_capacity)]
+        obj.common_item_count = U32.unpack(f.read(4))[0]
+        obj.common_items = InventoryItems.read(f, common_capacity)
 
         # Read key items
-        obj.key_item_count = struct.unpack("<I", f.read(4))[0]
-        obj.key_items = [InventoryItem.read(f) for _ in range(key_capacity)]
+        obj.key_item_count = U32.unpack(f.read(4))[0]
+        obj.key_items = InventoryItems.read(f, key_capacity)
 
         # Read counters
-        obj.equip_index_counter = struct.unpack("<I", f.read(4))[0]
-        obj.acquisition_index_counter = struct.unpack("<I", f.read(4))[0]
+        obj.equip_index_counter, obj.acquisition_index_counter = U32x2.unpack(f.read(8))
 
         return obj
 
     def write(self, f: BytesIO):
         """Write Inventory to stream"""
         # Write common items
-        f.write(struct.pack("<I", self.common_item_count))
-        for item in self.common_items:
-            item.write(f)
+        f.write(U32.pack(self.common_item_count))
+        self.common_items.write(f)
 
         # Write key items
-        f.write(struct.pack("<I", self.key_item_count))
-        for item in self.key_items:
-            item.write(f)
+        f.write(U32.pack(self.key_item_count))
+        self.key_items.write(f)
 
         # Write counters
-        f.write(struct.pack("<I", self.equip_index_counter))
-        f.write(struct.pack("<I", self.acquisition_index_counter))
+        f.write(U32x2.pack(self.equip_index_counter, self.acquisition_index_counter))
 
 
 # ============================================================================
@@ -279,28 +270,26 @@ class Inventory:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Spell:
     """Single spell slot (8 bytes)"""
 
+    _STRUCT = U32x2
+
     spell_id: int = 0
     unk0x4: int = 0
 
     @classmethod
     def read(cls, f: BytesIO) -> Spell:
         """Read Spell from stream (8 bytes)"""
-        return cls(
-            spell_id=struct.unpack("<I", f.read(4))[0],
-            unk0x4=struct.unpack("<I", f.read(4))[0],
-        )
+        return cls(*cls._STRUCT.unpack(f.read(cls._STRUCT.size)))
 
     def write(self, f: BytesIO):
         """Write Spell to stream (8 bytes)"""
-        f.write(struct.pack("<I", self.spell_id))
-        f.write(struct.pack("<I", self.unk0x4))
+        f.write(self._STRUCT.pack(self.spell_id, self.unk0x4))
 
 
-@dataclass
+@dataclass(slots=True)
 class EquippedSpells:
     """Equipped spells (0x74 = 116 bytes: 14 spells — 8 bytes + 4 bytes active index)"""
 
@@ -311,15 +300,17 @@ class EquippedSpells:
     def read(cls, f: BytesIO) -> EquippedSpells:
         """Read EquippedSpells from stream (116 bytes)"""
         obj = cls()
-        obj.spell_slots = [Spell.read(f) for _ in range(14)]
-        obj.active_index = struct.unpack("<I", f.read(4))[0]
+        obj.spell_slots = [Spell(*t) for t in read_fixed_array(f, Spell._STRUCT, 14)]
+        obj.active_index = U32.unpack(f.read(4))[0]
         return obj
 
     def write(self, f: BytesIO):
         """Write EquippedSpells to stream (116 bytes)"""
-        for spell in self.spell_slots:
-            spell.write(f)
-        f.write(struct.pack("<I", self.active_index))
+        pack = Spell._STRUCT.pack
+        f.write(
+            b"".join(pack(s.spell_id, s.unk0x4) for s in self.spell_slots)
+            + U32.pack(self.active_index)
+        )
 
 
 # ============================================================================
@@ -327,28 +318,26 @@ class EquippedSpells:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class EquippedItem:
     """Single equipped item (8 bytes)"""
 
+    _STRUCT = U32x2
+
     gaitem_handle: int = 0
     equip_index: int = 0
 
     @classmethod
     def read(cls, f: BytesIO) -> EquippedItem:
         """Read EquippedItem from stream (8 bytes)"""
-        return cls(
-            gaitem_handle=struct.unpack("<I", f.read(4))[0],
-            equip_index=struct.unpack("<I", f.read(4))[0],
-        )
+        return cls(*cls._STRUCT.unpack(f.read(cls._STRUCT.size)))
 
     def write(self, f: BytesIO):
         """Write EquippedItem to stream (8 bytes)"""
-        f.write(struct.pack("<I", self.gaitem_handle))
-        f.write(struct.pack("<I", self.equip_index))
+        f.write(self._STRUCT.pack(self.gaitem_handle, self.equip_index))
 
 
-@dataclass
+@dataclass(slots=True)
 class EquippedItems:
     """Equipped items (0x8C = 140 bytes: 10 quick + 6 pouch + 2 fields)"""
 
@@ -362,22 +351,24 @@ class EquippedItems:
     def read(cls, f: BytesIO) -> EquippedItems:
         """Read EquippedItems from stream (140 bytes)"""
         obj = cls()
-        obj.quick_items = [EquippedItem.read(f) for _ in range(10)]
-        obj.active_quick_item_index = struct.unpack("<I", f.read(4))[0]
-        obj.pouch_items = [EquippedItem.read(f) for _ in range(6)]
-        obj.unk0x84 = struct.unpack("<I", f.read(4))[0]
-        obj.unk0x88 = struct.unpack("<I", f.read(4))[0]
+        obj.quick_items = [
+            EquippedItem(*t) for t in read_fixed_array(f, EquippedItem._STRUCT, 10)
+        ]
+        obj.active_quick_item_index = U32.unpack(f.read(4))[0]
+        obj.pouch_items = [
+            EquippedItem(*t) for t in read_fixed_array(f, EquippedItem._STRUCT, 6)
+        ]
+        obj.unk0x84, obj.unk0x88 = U32x2.unpack(f.read(8))
         return obj
 
     def write(self, f: BytesIO):
         """Write EquippedItems to stream (140 bytes)"""
-        for item in self.quick_items:
-            item.write(f)
-        f.write(struct.pack("<I", self.active_quick_item_index))
-        for item in self.pouch_items:
-            item.write(f)
-        f.write(struct.pack("<I", self.unk0x84))
-        f.write(struct.pack("<I", self.unk0x88))
+        pack = EquippedItem._STRUCT.pack
+        parts = [pack(i.gaitem_handle, i.equip_index) for i in self.quick_items]
+        parts.append(U32.pack(self.active_quick_item_index))
+        parts.extend(pack(i.gaitem_handle, i.equip_index) for i in self.pouch_items)
+        parts.append(U32x2.pack(self.unk0x84, self.unk0x88))
+        f.write(b"".join(parts))
 
 
 # ============================================================================
@@ -385,7 +376,7 @@ class EquippedItems:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class EquippedGestures:
     """Equipped gestures (0x18 = 24 bytes: 6 gestures — 4 bytes)"""
 
@@ -395,37 +386,34 @@ class EquippedGestures:
     def read(cls, f: BytesIO) -> EquippedGestures:
         """Read EquippedGestures from stream (24 bytes)"""
         obj = cls()
-        obj.gesture_ids = [struct.unpack("<I", f.read(4))[0] for _ in range(6)]
+        obj.gesture_ids = read_u32_list(f, 6)
         return obj
 
     def write(self, f: BytesIO):
         """Write EquippedGestures to stream (24 bytes)"""
-        for gesture_id in self.gesture_ids:
-            f.write(struct.pack("<I", gesture_id))
+        write_u32_list(f, self.gesture_ids)
 
 
-@dataclass
+@dataclass(slots=True)
 class Projectile:
     """Single projectile entry (8 bytes)"""
 
     id: int = 0
     unk0x4: int = 0
 
+    _STRUCT = U32x2
+
     @classmethod
     def read(cls, f: BytesIO) -> Projectile:
         """Read Projectile from stream (8 bytes)"""
-        return cls(
-            id=struct.unpack("<I", f.read(4))[0],
-            unk0x4=struct.unpack("<I", f.read(4))[0],
-        )
+        return cls(*cls._STRUCT.unpack(f.read(cls._STRUCT.size)))
 
     def write(self, f: BytesIO):
         """Write Projectile to stream (8 bytes)"""
-        f.write(struct.pack("<I", self.id))
-        f.write(struct.pack("<I", self.unk0x4))
+        f.write(self._STRUCT.pack(self.id, self.unk0x4))
 
 
-@dataclass
+@dataclass(slots=True)
 class AcquiredProjectiles:
     """
     Acquired projectiles (VARIABLE size based on count)
@@ -439,27 +427,26 @@ class AcquiredProjectiles:
     def read(cls, f: BytesIO) -> AcquiredProjectiles:
         """Read AcquiredProjectiles from stream (variable size based on count)"""
         obj = cls()
-        obj.count = struct.unpack("<I", f.read(4))[0]
+        obj.count = U32.unpack(f.read(4))[0]
 
         # Read exactly count projectiles (each is 8 bytes)
-        obj.projectiles = [Projectile.read(f) for _ in range(obj.count)]
+        obj.projectiles = [
+            Projectile(*t) for t in read_fixed_array(f, Projectile._STRUCT, obj.count)
+        ]
 
         return obj
 
     def write(self, f: BytesIO):
         """Write AcquiredProjectiles to stream"""
-        start_pos = f.tell()
-        f.write(struct.pack("<I", self.count))
-        for proj in self.projectiles:
-            proj.write(f)
+        pack = Projectile._STRUCT.pack
+        data = U32.pack(self.count) + b"".join(
+            pack(p.id, p.unk0x4) for p in self.projectiles
+        )
         # Pad to 0x7CC bytes
-        bytes_written = f.tell() - start_pos
-        remaining = 0x7CC - bytes_written
-        if remaining > 0:
-            f.write(b"\x00" * remaining)
+        f.write(data.ljust(0x7CC, b"\x00"))
 
 
-@dataclass
+@dataclass(slots=True)
 class EquippedArmamentsAndItems:
     """Complete equipped state (0x9C = 156 bytes: 39 items — 4 bytes)"""
 
@@ -503,95 +490,61 @@ class EquippedArmamentsAndItems:
     pouch6: int = 0
     unk0x98: int = 0
 
+    _STRUCT = struct.Struct("<39I")
+
     @classmethod
     def read(cls, f: BytesIO) -> EquippedArmamentsAndItems:
         """Read EquippedArmamentsAndItems from stream (156 bytes)"""
-        return cls(
-            left_hand_armament1=struct.unpack("<I", f.read(4))[0],
-            right_hand_armament1=struct.unpack("<I", f.read(4))[0],
-            left_hand_armament2=struct.unpack("<I", f.read(4))[0],
-            right_hand_armament2=struct.unpack("<I", f.read(4))[0],
-            left_hand_armament3=struct.unpack("<I", f.read(4))[0],
-            right_hand_armament3=struct.unpack("<I", f.read(4))[0],
-            arrows1=struct.unpack("<I", f.read(4))[0],
-            bolts1=struct.unpack("<I", f.read(4))[0],
-            arrows2=struct.unpack("<I", f.read(4))[0],
-            bolts2=struct.unpack("<I", f.read(4))[0],
-            unk0x28=struct.unpack("<I", f.read(4))[0],
-            unk0x2c=struct.unpack("<I", f.read(4))[0],
-            head=struct.unpack("<I", f.read(4))[0],
-            chest=struct.unpack("<I", f.read(4))[0],
-            arms=struct.unpack("<I", f.read(4))[0],
-            legs=struct.unpack("<I", f.read(4))[0],
-            unk0x40=struct.unpack("<I", f.read(4))[0],
-            talisman1=struct.unpack("<I", f.read(4))[0],
-            talisman2=struct.unpack("<I", f.read(4))[0],
-            talisman3=struct.unpack("<I", f.read(4))[0],
-            talisman4=struct.unpack("<I", f.read(4))[0],
-            unk0x54=struct.unpack("<I", f.read(4))[0],
-            quickitem1=struct.unpack("<I", f.read(4))[0],
-            quickitem2=struct.unpack("<I", f.read(4))[0],
-            quickitem3=struct.unpack("<I", f.read(4))[0],
-            quickitem4=struct.unpack("<I", f.read(4))[0],
-            quickitem5=struct.unpack("<I", f.read(4))[0],
-            quickitem6=struct.unpack("<I", f.read(4))[0],
-            quickitem7=struct.unpack("<I", f.read(4))[0],
-            quickitem8=struct.unpack("<I", f.read(4))[0],
-            quickitem9=struct.unpack("<I", f.read(4))[0],
-            quickitem10=struct.unpack("<I", f.read(4))[0],
-            pouch1=struct.unpack("<I", f.read(4))[0],
-            pouch2=struct.unpack("<I", f.read(4))[0],
-            pouch3=struct.unpack("<I", f.read(4))[0],
-            pouch4=struct.unpack("<I", f.read(4))[0],
-            pouch5=struct.unpack("<I", f.read(4))[0],
-            pouch6=struct.unpack("<I", f.read(4))[0],
-            unk0x98=struct.unpack("<I", f.read(4))[0],
-        )
+        return cls(*cls._STRUCT.unpack(f.read(cls._STRUCT.size)))
 
     def write(self, f: BytesIO):
         """Write EquippedArmamentsAndItems to stream (156 bytes)"""
-        f.write(struct.pack("<I", self.left_hand_armament1))
-        f.write(struct.pack("<I", self.right_hand_armament1))
-        f.write(struct.pack("<I", self.left_hand_armament2))
-        f.write(struct.pack("<I", self.right_hand_armament2))
-        f.write(struct.pack("<I", self.left_hand_armament3))
-        f.write(struct.pack("<I", self.right_hand_armament3))
-        f.write(struct.pack("<I", self.arrows1))
-        f.write(struct.pack("<I", self.bolts1))
-        f.write(struct.pack("<I", self.arrows2))
-        f.write(struct.pack("<I", self.bolts2))
-        f.write(struct.pack("<I", self.unk0x28))
-        f.write(struct.pack("<I", self.unk0x2c))
-        f.write(struct.pack("<I", self.head))
-        f.write(struct.pack("<I", self.chest))
-        f.write(struct.pack("<I", self.arms))
-        f.write(struct.pack("<I", self.legs))
-        f.write(struct.pack("<I", self.unk0x40))
-        f.write(struct.pack("<I", self.talisman1))
-        f.write(struct.pack("<I", self.talisman2))
-        f.write(struct.pack("<I", self.talisman3))
-        f.write(struct.pack("<I", self.talisman4))
-        f.write(struct.pack("<I", self.unk0x54))
-        f.write(struct.pack("<I", self.quickitem1))
-        f.write(struct.pack("<I", self.quickitem2))
-        f.write(struct.pack("<I", self.quickitem3))
-        f.write(struct.pack("<I", self.quickitem4))
-        f.write(struct.pack("<I", self.quickitem5))
-        f.write(struct.pack("<I", self.quickitem6))
-        f.write(struct.pack("<I", self.quickitem7))
-        f.write(struct.pack("<I", self.quickitem8))
-        f.write(struct.pack("<I", self.quickitem9))
-        f.write(struct.pack("<I", self.quickitem10))
-        f.write(struct.pack("<I", self.pouch1))
-        f.write(struct.pack("<I", self.pouch2))
-        f.write(struct.pack("<I", self.pouch3))
-        f.write(struct.pack("<I", self.pouch4))
-        f.write(struct.pack("<I", self.pouch5))
-        f.write(struct.pack("<I", self.pouch6))
-        f.write(struct.pack("<I", self.unk0x98))
-
-
-@dataclass
+        f.write(
+            self._STRUCT.pack(
+                self.left_hand_armament1,
+                self.right_hand_armament1,
+                self.left_hand_armament2,
+                self.right_hand_armament2,
+                self.left_hand_armament3,
+                self.right_hand_armament3,
+                self.arrows1,
+                self.bolts1,
+                self.arrows2,
+                self.bolts2,
+                self.unk0x28,
+                self.unk0x2c,
+                self.head,
+                self.chest,
+                self.arms,
+                self.legs,
+                self.unk0x40,
+                self.talisman1,
+                self.talisman2,
+                self.talisman3,
+                self.talisman4,
+                self.unk0x54,
+                self.quickitem1,
+                self.quickitem2,
+                self.quickitem3,
+                self.quickitem4,
+                self.quickitem5,
+                self.quickitem6,
+                self.quickitem7,
+                self.quickitem8,
+                self.quickitem9,
+                self.quickitem10,
+                self.pouch1,
+                self.pouch2,
+                self.pouch3,
+                self.pouch4,
+                self.pouch5,
+                self.pouch6,
+                self.unk0x98,
+            )
+        )
+
+
+@dataclass(slots=True)
 class EquippedPhysics:
     """Wondrous Physick tears (0xC = 12 bytes)"""
 
@@ -599,20 +552,22 @@ class EquippedPhysics:
     slot2: int = 0
     unk0x8: int = 0
 
+    _STRUCT = struct.Struct("<3I")
+
     @classmethod
     def read(cls, f: BytesIO) -> EquippedPhysics:
         """Read EquippedPhysics from stream (12 bytes)"""
-        return cls(
-            slot1=struct.unpack("<I", f.read(4))[0],
-            slot2=struct.unpack("<I", f.read(4))[0],
-            unk0x8=struct.unpack("<I", f.read(4))[0],
-        )
+        return cls(*cls._STRUCT.unpack(f.read(cls._STRUCT.size)))
 
     def write(self, f: BytesIO):
         """Write EquippedPhysics to stream (12 bytes)"""
-        f.write(struct.pack("<I", self.slot1))
-        f.write(struct.pack("<I", self.slot2))
-        f.write(struct.pack("<I", self.unk0x8))
+        f.write(
+            self._STRUCT.pack(
+                self.slot1,
+                self.slot2,
+                self.unk0x8,
+            )
+        )
 
 
 # ============================================================================
@@ -620,20 +575,20 @@ class EquippedPhysics:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class TrophyEquipData:
     """Trophy equipment data (0x34 = 52 bytes)"""
 
     unk0x0: int = 0
-    unk0x4: bytes = field(default_factory=lambda: b"\x00" * 0x10)
-    unk0x14: bytes = field(default_factory=lambda: b"\x00" * 0x10)
-    unk0x24: bytes = field(default_factory=lambda: b"\x00" * 0x10)
+    unk0x4: bytes = bytes(0x10)
+    unk0x14: bytes = bytes(0x10)
+    unk0x24: bytes = bytes(0x10)
 
     @classmethod
     def read(cls, f: BytesIO) -> TrophyEquipData:
         """Read TrophyEquipData from stream (52 bytes)"""
         return cls(
-            unk0x0=struct.unpack("<I", f.read(4))[0],
+            unk0x0=U32.unpack(f.read(4))[0],
             unk0x4=f.read(0x10),
             unk0x14=f.read(0x10),
             unk0x24=f.read(0x10),
@@ -641,7 +596,7 @@ class TrophyEquipData:
 
     def write(self, f: BytesIO):
         """Write TrophyEquipData to stream (52 bytes)"""
-        f.write(struct.pack("<I", self.unk0x0))
+        f.write(U32.pack(self.unk0x0))
         f.write(self.unk0x4)
         f.write(self.unk0x14)
         f.write(self.unk0x24)
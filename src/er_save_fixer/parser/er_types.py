@@ -8,10 +8,13 @@ Based on ER-Save-Lib Rust implementation.
 from __future__ import annotations
 
 import struct
-from dataclasses import dataclass, field
+from array import array
+from dataclasses import astuple, dataclass
 from enum import IntEnum
 from io import BytesIO
 
+from ._structs import U32, F32x3, F32x4, U32x2
+
 # ============================================================================
 # ENUMS
 # ============================================================================
@@ -53,15 +56,7 @@ class Util:
         Returns:
             Decoded string with trailing nulls stripped
         """
-        bytes_to_read = max_chars * 2
-        data = f.read(bytes_to_read)
-        try:
-            # Decode the full data
-            decoded = data.decode("utf-16le", errors="ignore")
-            # Strip trailing null characters
-            return decoded.rstrip("\x00")
-        except Exception:
-            return ""
+        return Util.decode_wstring(f.read(max_chars * 2))
 
     @staticmethod
     def write_wstring(f: BytesIO, s: str, max_chars: int):
@@ -73,22 +68,170 @@ class Util:
             s: String to write
             max_chars: Maximum number of characters (not bytes)
         """
-        encoded = s.encode("utf-16le")
+        f.write(Util.encode_wstring(s, max_chars))
+
+    @staticmethod
+    def decode_wstring(data: bytes) -> str:
+        """
+        Decode a UTF-16LE string field, stripping trailing nulls.
+
+        Bytes after the first terminator are kept so encode_wstring()
+        round-trips them. errors="ignore" cannot raise, so no try/except.
+        """
+        return data.decode("utf-16le", errors="ignore").rstrip("\x00")
+
+    @staticmethod
+    def encode_wstring(s: str, max_chars: int) -> bytes:
+        """Encode to UTF-16LE, truncated and null-padded to max_chars"""
         bytes_to_write = max_chars * 2
-        if len(encoded) > bytes_to_write:
-            encoded = encoded[:bytes_to_write]
-        f.write(encoded)
-        remaining = bytes_to_write - len(encoded)
-        if remaining > 0:
-            f.write(b"\x00" * remaining)
+        return s.encode("utf-16le")[:bytes_to_write].ljust(bytes_to_write, b"\x00")
+
+
+def read_fixed_array(f: BytesIO, struct_obj: struct.Struct, count: int) -> list[tuple]:
+    """
+    Read `count` consecutive fixed-size records with a single read.
+
+    Args:
+        f: BytesIO stream to read from
+        struct_obj: Precompiled struct describing one record
+        count: Number of records to read
+
+    Returns:
+        List of unpacked tuples, one per record
+    """
+    buf = f.read(struct_obj.size * count)
+    return list(struct_obj.iter_unpack(buf))
+
+
+def read_u32_list(f: BytesIO, count: int) -> list[int]:
+    """
+    Read `count` consecutive little-endian u32 values with a single read.
+
+    Args:
+        f: BytesIO stream to read from
+        count: Number of values to read
+
+    Returns:
+        List of ints
+    """
+    return list(struct.unpack(f"<{count}I", f.read(4 * count)))
+
+
+def write_u32_list(f: BytesIO, values: list[int]):
+    """
+    Write little-endian u32 values with a single pack and write.
+
+    Args:
+        f: BytesIO stream to write to
+        values: Values to write
+    """
+    f.write(struct.pack(f"<{len(values)}I", *values))
+
+
+class PackedRecords:
+    """
+    Fixed-count run of fixed-size records, decoded on access
+
+    Keeps the raw records and only builds record objects when indexed or
+    iterated. Those are frozen snapshots; change an entry by assigning a
+    new record, e.g. records[i] = replace(records[i], field=value), or
+    work on a plain list from materialize(). The record count is fixed,
+    so there is no append/insert/del. Unchanged records are written back
+    byte for byte.
+
+    Subclasses set _RECORD to a frozen dataclass whose _STRUCT packs its
+    fields in declaration order.
+    """
+
+    __slots__ = ("_buf",)
+
+    _RECORD: type
+
+    def __init__(self, data: bytes | bytearray = b""):
+        self._buf = data
+
+    @classmethod
+    def read(cls, f: BytesIO, count: int):
+        """Read `count` records in one read"""
+        return cls(f.read(cls._RECORD._STRUCT.size * count))
+
+    def write(self, f: BytesIO):
+        """Write all records to stream"""
+        f.write(self._buf)
+
+    def __len__(self) -> int:
+        return len(self._buf) // self._RECORD._STRUCT.size
+
+    def _offset(self, index: int) -> int:
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return index * self._RECORD._STRUCT.size
+
+    def __getitem__(self, index: int):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        record = self._RECORD
+        return record(*record._STRUCT.unpack_from(self._buf, self._offset(index)))
+
+    def __setitem__(self, index: int | slice, item):
+        if isinstance(index, slice):
+            # Fixed capacity: a slice can be replaced, not resized
+            indices = range(*index.indices(len(self)))
+            items = list(item)
+            if len(items) != len(indices):
+                raise ValueError(
+                    f"{type(self).__name__} has a fixed size: cannot assign "
+                    f"{len(items)} records to a slice of {len(indices)}"
+                )
+            for i, record in zip(indices, items, strict=True):
+                self[i] = record
+            return
+
+        if not isinstance(item, self._RECORD):
+            raise TypeError(
+                f"{type(self).__name__} holds {self._RECORD.__name__}, "
+                f"not {type(item).__name__}"
+            )
+        offset = self._offset(index)
+        if not isinstance(self._buf, bytearray):
+            # Copy on first write
+            self._buf = bytearray(self._buf)
+        self._RECORD._STRUCT.pack_into(self._buf, offset, *astuple(item))
+
+    def __iter__(self):
+        record = self._RECORD
+        for t in record._STRUCT.iter_unpack(self._buf):
+            yield record(*t)
+
+    def materialize(self) -> list:
+        """Decode every record into a plain list"""
+        return list(self)
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            return self.materialize() == other
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._buf == other._buf
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({len(self)} entries)"
 
 
 # ============================================================================
 # BASIC DATA TYPES
 # ============================================================================
 
+# Shared default for MapId (bytes are immutable, so one instance is enough)
+_EMPTY_MAPID = b"\x00\x00\x00\x00"
 
-@dataclass
+
+@dataclass(slots=True)
 class FloatVector3:
     """3D float vector (12 bytes)"""
 
@@ -99,18 +242,26 @@ class FloatVector3:
     @classmethod
     def read(cls, f: BytesIO) -> FloatVector3:
         """Read FloatVector3 from stream"""
-        x, y, z = struct.unpack("<fff", f.read(12))
+        x, y, z = F32x3.unpack(f.read(12))
         return cls(x, y, z)
 
     def write(self, f: BytesIO):
         """Write FloatVector3 to stream"""
-        f.write(struct.pack("<fff", self.x, self.y, self.z))
+        f.write(self.to_bytes())
+
+    def to_bytes(self) -> bytes:
+        """Pack to the 12-byte on-disk form"""
+        return F32x3.pack(self.x, self.y, self.z)
+
+    def is_zero(self) -> bool:
+        """Check if all components are zero"""
+        return self.x == 0.0 and self.y == 0.0 and self.z == 0.0
 
     def __str__(self):
         return f"({self.x:.2f}, {self.y:.2f}, {self.z:.2f})"
 
 
-@dataclass
+@dataclass(slots=True)
 class FloatVector4:
     """4D float vector (16 bytes) - typically used for quaternions/angles"""
 
@@ -122,25 +273,58 @@ class FloatVector4:
     @classmethod
     def read(cls, f: BytesIO) -> FloatVector4:
         """Read FloatVector4 from stream"""
-        x, y, z, w = struct.unpack("<ffff", f.read(16))
+        x, y, z, w = F32x4.unpack(f.read(16))
         return cls(x, y, z, w)
 
     def write(self, f: BytesIO):
         """Write FloatVector4 to stream"""
-        f.write(struct.pack("<ffff", self.x, self.y, self.z, self.w))
+        f.write(self.to_bytes())
+
+    def to_bytes(self) -> bytes:
+        """Pack to the 16-byte on-disk form"""
+        return F32x4.pack(self.x, self.y, self.z, self.w)
+
+    def is_zero(self) -> bool:
+        """Check if all components are zero"""
+        return self.x == 0.0 and self.y == 0.0 and self.z == 0.0 and self.w == 0.0
 
     def __str__(self):
         return f"({self.x:.2f}, {self.y:.2f}, {self.z:.2f}, {self.w:.2f})"
 
 
-@dataclass
 class MapId:
     """
     Map ID (4 bytes)
     Represents the current map/area in the game.
+
+    The decimal/hex string forms are computed on first use and cached on
+    the instance; assigning `data` clears them.
     """
 
-    data: bytes = field(default_factory=lambda: b"\x00\x00\x00\x00")
+    __slots__ = ("_data", "_decimal", "_hex")
+
+    def __init__(self, data: bytes = _EMPTY_MAPID):
+        self.data = data
+
+    @property
+    def data(self) -> bytes:
+        return self._data
+
+    @data.setter
+    def data(self, value: bytes):
+        self._data = value
+        self._decimal = None
+        self._hex = None
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.data == other.data
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"MapId(data={self.data!r})"
 
     @classmethod
     def read(cls, f: BytesIO) -> MapId:
@@ -156,7 +340,10 @@ class MapId:
         Convert to decimal map coordinates.
         Format: "AA BB CC DD"
         """
-        return f"{self.data[3]:d} {self.data[2]:d} {self.data[1]:d} {self.data[0]:d}"
+        if self._decimal is None:
+            data = self.data
+            self._decimal = f"{data[3]:d} {data[2]:d} {data[1]:d} {data[0]:d}"
+        return self._decimal
 
     def to_string_decimal(self) -> str:
         """Alias for to_decimal() for backward compatibility"""
@@ -167,7 +354,10 @@ class MapId:
         Convert to hex string format.
         Format: "AA_BB_CC_DD"
         """
-        return f"{self.data[0]:02X}_{self.data[1]:02X}_{self.data[2]:02X}_{self.data[3]:02X}"
+        if self._hex is None:
+            data = self.data
+            self._hex = f"{data[0]:02X}_{data[1]:02X}_{data[2]:02X}_{data[3]:02X}"
+        return self._hex
 
     def __str__(self):
         return self.to_decimal()
@@ -221,8 +411,15 @@ class MapId:
 # GAITEM - Variable Length Structure (CRITICAL!)
 # ============================================================================
 
+# Gaitem tails: unk0x10/unk0x14, then gem_gaitem_handle/unk0x1c (5 bytes)
+_GAITEM_EXT = struct.Struct("<ii")
+_GAITEM_GEM = struct.Struct("<iB")
+# Both tails together, as stored for gem items (13 bytes)
+_GAITEM_EXT_GEM = struct.Struct("<iiiB")
+_GAITEM_MAX_SIZE = 8 + _GAITEM_EXT_GEM.size
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Gaitem:
     """
     Variable-length item structure (8-17 bytes)
@@ -237,6 +434,8 @@ class Gaitem:
 
     The save file contains 5118 (version <= 81) or 5120 (version > 81) of these.
     If not parsed correctly, allsubsequent data will be misaligned
+
+    Immutable: change an entry with dataclasses.replace().
     """
 
     gaitem_handle: int = 0
@@ -255,42 +454,37 @@ class Gaitem:
             Gaitem instance with appropriate fields populated
         """
         # Always read base 8 bytes
-        gaitem_handle = struct.unpack("<I", f.read(4))[0]
-        item_id = struct.unpack("<I", f.read(4))[0]
-
-        obj = cls(gaitem_handle=gaitem_handle, item_id=item_id)
+        gaitem_handle, item_id = U32x2.unpack(f.read(8))
+        extra = ()
 
         # Conditional reading based on handle type
         handle_type = gaitem_handle & 0xF0000000
 
         if gaitem_handle != 0 and handle_type != 0xC0000000:
             # Read additional 8 bytes
-            obj.unk0x10 = struct.unpack("<i", f.read(4))[0]
-            obj.unk0x14 = struct.unpack("<i", f.read(4))[0]
+            extra = _GAITEM_EXT.unpack(f.read(8))
 
             if handle_type == 0x80000000:
                 # Read additional 5 bytes (for gem items)
-                obj.gem_gaitem_handle = struct.unpack("<i", f.read(4))[0]
-                obj.unk0x1c = struct.unpack("<B", f.read(1))[0]
+                extra += _GAITEM_GEM.unpack(f.read(5))
 
-        return obj
+        return cls(gaitem_handle, item_id, *extra)
 
     def write(self, f: BytesIO):
         """Write Gaitem to stream with conditional field writing"""
         # Always write base 8 bytes
-        f.write(struct.pack("<I", self.gaitem_handle))
-        f.write(struct.pack("<I", self.item_id))
+        f.write(U32x2.pack(self.gaitem_handle, self.item_id))
 
         # Conditional writing based on handle type
         handle_type = self.gaitem_handle & 0xF0000000
 
         if self.gaitem_handle != 0 and handle_type != 0xC0000000:
-            f.write(struct.pack("<i", self.unk0x10 or 0))
-            f.write(struct.pack("<i", self.unk0x14 or 0))
+            f.write(_GAITEM_EXT.pack(self.unk0x10 or 0, self.unk0x14 or 0))
 
             if handle_type == 0x80000000:
-                f.write(struct.pack("<i", self.gem_gaitem_handle or 0))
-                f.write(struct.pack("<B", self.unk0x1c or 0))
+                f.write(
+                    _GAITEM_GEM.pack(self.gem_gaitem_handle or 0, self.unk0x1c or 0)
+                )
 
     def get_size(self) -> int:
         """
@@ -311,3 +505,204 @@ class Gaitem:
 
     def __str__(self):
         return f"Gaitem(handle=0x{self.gaitem_handle:08X}, item_id={self.item_id}, size={self.get_size()})"
+
+
+class GaitemMap:
+    """
+    Gaitem map stored as columns (struct of arrays)
+
+    Handles and item ids are kept in two array("I") columns, and only the
+    entries that carry extra bytes keep them, as a tuple in `ext` keyed by
+    index. That is ~40KB per slot instead of 5120 Gaitem instances.
+
+    A map loaded with read() only walks the handles to find where it ends
+    and keeps the raw bytes; the columns are decoded on first access, and
+    an untouched map is written back verbatim.
+
+    Indexing and iteration build frozen Gaitem snapshots on demand; change
+    an entry by assigning one back, e.g. map[i] = replace(map[i], item_id=x).
+    The entry count is fixed by the save version, so there is no append,
+    insert or del.
+    """
+
+    __slots__ = ("_raw", "_count", "_handles", "_item_ids", "_ext")
+
+    def __init__(
+        self,
+        handles: array | None = None,
+        item_ids: array | None = None,
+        ext: dict[int, tuple[int, ...]] | None = None,
+    ):
+        self._raw = None
+        self._count = 0
+        self._handles = handles if handles is not None else array("I")
+        self._item_ids = item_ids if item_ids is not None else array("I")
+        self._ext = ext if ext is not None else {}
+
+    @classmethod
+    def read(cls, f: BytesIO, count: int) -> GaitemMap:
+        """
+        Read `count` consecutive Gaitems with a single read.
+
+        Reads the worst-case span (21 bytes per item) in one go, walks the
+        handles to find the end of the last item, then seeks the stream
+        back there. Decoding into columns is deferred to first access.
+        """
+        start = f.tell()
+        buf = f.read(count * _GAITEM_MAX_SIZE)
+
+        unpack_handle = U32.unpack_from
+        off = 0
+        for _ in range(count):
+            gaitem_handle = unpack_handle(buf, off)[0]
+            off += 8
+
+            handle_type = gaitem_handle & 0xF0000000
+            if gaitem_handle != 0 and handle_type != 0xC0000000:
+                if handle_type == 0x80000000:
+                    off += 13
+                else:
+                    off += 8
+
+        f.seek(start + off)
+        obj = cls()
+        obj._raw = buf[:off]
+        obj._count = count
+        return obj
+
+    def _decode(self):
+        """Decode the raw bytes kept by read() into the columns"""
+        buf = self._raw
+        unpack_base = U32x2.unpack_from
+        unpack_ext = _GAITEM_EXT.unpack_from
+        unpack_ext_gem = _GAITEM_EXT_GEM.unpack_from
+
+        handles = self._handles
+        item_ids = self._item_ids
+        ext = self._ext
+        add_handle = handles.append
+        add_item_id = item_ids.append
+        off = 0
+        for i in range(self._count):
+            gaitem_handle, item_id = unpack_base(buf, off)
+            off += 8
+            add_handle(gaitem_handle)
+            add_item_id(item_id)
+
+            handle_type = gaitem_handle & 0xF0000000
+            if gaitem_handle != 0 and handle_type != 0xC0000000:
+                if handle_type == 0x80000000:
+                    ext[i] = unpack_ext_gem(buf, off)
+                    off += 13
+                else:
+                    ext[i] = unpack_ext(buf, off)
+                    off += 8
+
+        self._raw = None
+
+    @property
+    def handles(self) -> array:
+        if self._raw is not None:
+            self._decode()
+        return self._handles
+
+    @property
+    def item_ids(self) -> array:
+        if self._raw is not None:
+            self._decode()
+        return self._item_ids
+
+    @property
+    def ext(self) -> dict[int, tuple[int, ...]]:
+        if self._raw is not None:
+            self._decode()
+        return self._ext
+
+    def write(self, f: BytesIO):
+        """Write all Gaitems to stream in file order"""
+        if self._raw is not None:
+            f.write(self._raw)
+            return
+
+        pack_base = U32x2.pack
+        pack_ext = _GAITEM_EXT.pack
+        pack_ext_gem = _GAITEM_EXT_GEM.pack
+        ext = self.ext
+
+        parts = []
+        add = parts.append
+        get_ext = ext.get
+        for i, (gaitem_handle, item_id) in enumerate(
+            zip(self.handles, self.item_ids, strict=True)
+        ):
+            add(pack_base(gaitem_handle, item_id))
+            tail = get_ext(i)
+            if tail is not None:
+                add(pack_ext_gem(*tail) if len(tail) == 4 else pack_ext(*tail))
+        f.write(b"".join(parts))
+
+    def get_size(self) -> int:
+        """Total size of the map in bytes"""
+        if self._raw is not None:
+            return len(self._raw)
+        # 8 base bytes each, plus 8 or 13 (gem items) for the extended ones
+        return 8 * len(self.handles) + sum(
+            _GAITEM_EXT_GEM.size if len(t) == 4 else _GAITEM_EXT.size
+            for t in self.ext.values()
+        )
+
+    def __len__(self) -> int:
+        if self._raw is not None:
+            return self._count
+        return len(self._handles)
+
+    def __getitem__(self, index: int) -> Gaitem:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.handles)))]
+        if index < 0:
+            index += len(self.handles)
+        return Gaitem(
+            self.handles[index], self.item_ids[index], *self.ext.get(index, ())
+        )
+
+    def __setitem__(self, index: int, item: Gaitem):
+        if not isinstance(item, Gaitem):
+            raise TypeError(f"GaitemMap holds Gaitem, not {type(item).__name__}")
+        if index < 0:
+            index += len(self.handles)
+        self.handles[index] = item.gaitem_handle
+        self.item_ids[index] = item.item_id
+
+        size = item.get_size()
+        if size == 21:
+            self.ext[index] = (
+                item.unk0x10 or 0,
+                item.unk0x14 or 0,
+                item.gem_gaitem_handle or 0,
+                item.unk0x1c or 0,
+            )
+        elif size == 16:
+            self.ext[index] = (item.unk0x10 or 0, item.unk0x14 or 0)
+        else:
+            self.ext.pop(index, None)
+
+    def __iter__(self):
+        ext = self.ext
+        for i, (gaitem_handle, item_id) in enumerate(
+            zip(self.handles, self.item_ids, strict=True)
+        ):
+            yield Gaitem(gaitem_handle, item_id, *ext.get(i, ()))
+
+    def __eq__(self, other):
+        if not isinstance(other, GaitemMap):
+            return NotImplemented
+        return (
+            self.handles == other.handles
+            and self.item_ids == other.item_ids
+            and self.ext == other.ext
+        )
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"GaitemMap({len(self.handles)} entries, {len(self.ext)} extended)"
@@ -80,7 +80,7 @@ class EventFlags:
         return cls._bst_map
 
     @classmethod
-    def get_flag(cls, event_flags: bytes, event_id: int) -> bool:
+    def get_flag(cls, event_flags: bytes | memoryview, event_id: int) -> bool:
         """
         Get the state of an event flag.
 
@@ -238,7 +238,7 @@ class CorruptionDetector:
     """Detect quest soft-locks and warp sickness issues."""
 
     @staticmethod
-    def check_ranni_softlock(event_flags: bytes) -> bool:
+    def check_ranni_softlock(event_flags: bytes | memoryview) -> bool:
         """
         Detect Ranni's Tower quest soft-lock.
 
@@ -250,7 +250,7 @@ class CorruptionDetector:
             return False
 
     @staticmethod
-    def check_radahn_alive_warp(event_flags: bytes) -> bool:
+    def check_radahn_alive_warp(event_flags: bytes | memoryview) -> bool:
         """
         Detect Radahn warp sickness (alive variant).
 
@@ -264,7 +264,7 @@ class CorruptionDetector:
             return False
 
     @staticmethod
-    def check_radahn_dead_warp(event_flags: bytes) -> bool:
+    def check_radahn_dead_warp(event_flags: bytes | memoryview) -> bool:
         """
         Detect Radahn warp sickness (dead variant).
 
@@ -280,7 +280,7 @@ class CorruptionDetector:
             return False
 
     @staticmethod
-    def check_morgott_warp(event_flags: bytes) -> bool:
+    def check_morgott_warp(event_flags: bytes | memoryview) -> bool:
         """
         Detect Morgott warp sickness.
 
@@ -295,7 +295,7 @@ class CorruptionDetector:
             return False
 
     @staticmethod
-    def check_radagon_warp(event_flags: bytes) -> bool:
+    def check_radagon_warp(event_flags: bytes | memoryview) -> bool:
         """
         Detect Radagon/Elden Beast warp sickness.
 
@@ -310,7 +310,7 @@ class CorruptionDetector:
             return False
 
     @staticmethod
-    def check_sealing_tree_warp(event_flags: bytes) -> bool:
+    def check_sealing_tree_warp(event_flags: bytes | memoryview) -> bool:
         """
         Detect Sealing Tree warp sickness (DLC).
 
@@ -327,7 +327,7 @@ class CorruptionDetector:
             return False
 
     @classmethod
-    def detect_all(cls, event_flags: bytes) -> list[str]:
+    def detect_all(cls, event_flags: bytes | memoryview) -> list[str]:
         """
         Detect all known corruption issues.
 
@@ -8,8 +8,10 @@ Based on ER-Save-Lib Rust implementation.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from io import BytesIO
+from functools import cached_property
+from io import SEEK_CUR, BytesIO
 
+from ._structs import U64
 from .user_data_10 import UserData10
 from .user_data_x import UserDataX
 
@@ -44,9 +46,10 @@ class Save:
     # Common section (parsed)
     user_data_10_parsed: UserData10 | None = None
 
-    # Additional data sections (raw)
-    user_data_10: bytes = b""
-    user_data_11: bytes = b""
+    # Additional data sections (raw), as views into the file as loaded (see
+    # UserDataX.read). Fixes and checksums patch _raw_data, not these
+    user_data_10: bytes | memoryview = b""
+    user_data_11: bytes | memoryview = b""
 
     @classmethod
     def from_file(cls, filepath: str) -> Save:
@@ -68,7 +71,8 @@ class Save:
 
         # Track original filepath for save() method
         obj._original_filepath = filepath
-        obj._raw_data = bytearray(data)  # Keep raw data for modifications
+        # Keep the loaded bytes; the mutable copy is made on first use
+        obj._source = data
 
         # Read magic (4 bytes)
         obj.magic = f.read(4)
@@ -107,13 +111,10 @@ class Save:
                     obj.character_slots.append(UserDataX())
                     break  # No more slots
 
-                # Display checksum
-                checksum.hex()
-
                 # Check if slot is empty (all zeros checksum)
                 if checksum == bytes(16):
-                    # Skip the character data for this slot
-                    f.read(0x280000)  # Skip empty slot data
+                    # Skip the character data for this slot (seek, no copy)
+                    f.seek(0x280000, SEEK_CUR)
                     obj.character_slots.append(UserDataX())  # Add empty slot
                     continue
 
@@ -125,20 +126,11 @@ class Save:
 
             # Parse character data
             try:
-                char = UserDataX.read(f, obj.is_ps, char_data_start, slot_data_size)
+                char = UserDataX.read(
+                    f, obj.is_ps, char_data_start, slot_data_size, source=data
+                )
                 obj.character_slots.append(char)
 
-                if char.is_empty():
-                    pass
-                else:
-                    # Check for issues
-                    if char.has_torrent_bug():
-                        pass
-                    if char.has_weather_corruption():
-                        pass
-                    if char.has_time_corruption():
-                        pass
-
             except Exception:
                 obj.character_slots.append(UserDataX())
                 # Skip to next slot boundary
@@ -153,29 +145,40 @@ class Save:
             # Parse USER_DATA_10
             obj.user_data_10_parsed = UserData10.read(f, obj.is_ps)
 
-            # Also keep raw bytes
+            # Also keep raw bytes (a view into the loaded file, no copy)
             user_data_10_end = f.tell()
-            f.seek(user_data_10_start)
-            obj.user_data_10 = f.read(user_data_10_end - user_data_10_start)
-            f.seek(user_data_10_end)
+            obj.user_data_10 = memoryview(data)[user_data_10_start:user_data_10_end]
         except Exception:
             # Fall back to reading raw bytes
             f.seek(user_data_10_start)
             if not obj.is_ps:
-                f.read(16)  # Skip checksum
-            obj.user_data_10 = f.read(0x60000)
+                f.seek(16, SEEK_CUR)  # Skip checksum
+            pos = f.tell()
+            obj.user_data_10 = memoryview(data)[pos : pos + 0x60000]
+            f.seek(len(obj.user_data_10), SEEK_CUR)
 
         # Read USER_DATA_11
         if not obj.is_ps:
-            f.read(16)  # Skip checksum
+            f.seek(16, SEEK_CUR)  # Skip checksum
 
-        if obj.is_ps:
-            obj.user_data_11 = f.read(0x240010)
-        else:
-            obj.user_data_11 = f.read(0x240010)
+        pos = f.tell()
+        obj.user_data_11 = memoryview(data)[pos : pos + 0x240010]
 
         return obj
 
+    @cached_property
+    def _raw_data(self) -> bytearray:
+        """
+        Mutable copy of the loaded file, for modifications.
+
+        Made on first access (fixes, checksums, writing), so loading a save
+        only to inspect it never copies the whole file. Raises
+        AttributeError if this Save was not loaded from a file.
+        """
+        raw = bytearray(self._source)
+        del self._source
+        return raw
+
     def recalculate_checksums(self):
         """
         Recalculate MD5 checksums for all active slots
@@ -188,6 +191,10 @@ class Save:
 
         import hashlib
 
+        # Checksums are written with slice assignment (same length), so the
+        # view stays valid for the whole pass
+        raw_view = memoryview(self._raw_data)
+
         # Recalculate for each active slot
         for slot_idx in range(10):
             slot = self.character_slots[slot_idx]
@@ -203,8 +210,8 @@ class Save:
             checksum_offset = slot_offset
             data_offset = slot_offset + CHECKSUM_SIZE
 
-            # Calculate MD5 of character data
-            char_data = self._raw_data[data_offset : data_offset + SLOT_SIZE]
+            # Calculate MD5 of character data (memoryview slice, no copy)
+            char_data = raw_view[data_offset : data_offset + SLOT_SIZE]
             md5_hash = hashlib.md5(char_data).digest()
 
             # Write checksum
@@ -219,7 +226,7 @@ class Save:
         userdata10_checksum_offset = userdata10_offset
         userdata10_data_offset = userdata10_offset + CHECKSUM_SIZE
 
-        userdata10_data = self._raw_data[
+        userdata10_data = raw_view[
             userdata10_data_offset : userdata10_data_offset + 0x60000
         ]
         md5_hash = hashlib.md5(userdata10_data).digest()
@@ -263,41 +270,76 @@ class Save:
             raise IndexError(f"Slot index must be 0-9, got {index}")
         return self.character_slots[index]
 
-    def print_summary(self):
-        """Print a summary of all character slots"""
+    def summary_dict(self) -> list[dict]:
+        """
+        Summarize all non-empty character slots as raw values.
 
-        if self.user_data_10_parsed:
-            pass
+        Returns:
+            One dict per active slot with keys: slot, name, level, runes,
+            hours, minutes (None if no ProfileSummary) and issues
+        """
+        profiles = []
+        if self.user_data_10_parsed and self.user_data_10_parsed.profile_summary:
+            profiles = self.user_data_10_parsed.profile_summary.profiles
 
-        self.get_active_slots()
+        summary = []
+        for slot_index, char in enumerate(self.character_slots):
+            if char.is_empty():
+                continue
 
-        for slot_index in range(10):
-            char = self.character_slots[slot_index]
+            hours = minutes = None
+            if slot_index < len(profiles):
+                seconds_played = profiles[slot_index].seconds_played
+                hours = seconds_played // 3600
+                minutes = (seconds_played % 3600) // 60
+
+            issues = []
+            if char.has_torrent_bug():
+                issues.append("Torrent bug")
+            if char.has_weather_corruption():
+                issues.append("Weather corruption")
+            if char.has_time_corruption():
+                issues.append("Time corruption")
+
+            summary.append(
+                {
+                    "slot": slot_index,
+                    "name": char.get_character_name(),
+                    "level": char.get_level(),
+                    "runes": char.player_game_data.runes,
+                    "hours": hours,
+                    "minutes": minutes,
+                    "issues": issues,
+                }
+            )
+        return summary
+
+    def format_summary(self) -> list[str]:
+        """
+        Format a summary of all character slots.
 
-            if char.is_empty():
-                pass
-            else:
-                # Show profile summary time played if available
-                if self.user_data_10_parsed and slot_index < len(
-                    self.user_data_10_parsed.profile_summary.profiles
-                ):
-                    profile = self.user_data_10_parsed.profile_summary.profiles[
-                        slot_index
-                    ]
-                    profile.seconds_played // 3600
-                    (profile.seconds_played % 3600) // 60
-
-                # Show issues
-                issues = []
-                if char.has_torrent_bug():
-                    issues.append("Torrent bug")
-                if char.has_weather_corruption():
-                    issues.append("Weather corruption")
-                if char.has_time_corruption():
-                    issues.append("Time corruption")
-
-                if issues:
-                    pass
+        Formatting only happens here; use summary_dict() for raw values.
+
+        Returns:
+            One formatted line per active slot
+        """
+        lines = []
+        for entry in self.summary_dict():
+            line = (
+                f"Slot {entry['slot'] + 1}: {entry['name']} "
+                f"(Lv. {entry['level']}, {entry['runes']:,} runes)"
+            )
+            if entry["hours"] is not None:
+                line += f" {entry['hours']}h {entry['minutes']:02d}m"
+            if entry["issues"]:
+                line += " - " + ", ".join(entry["issues"])
+            lines.append(line)
+        return lines
+
+    def print_summary(self):
+        """Print a summary of all character slots"""
+        for line in self.format_summary():
+            print(line)  # noqa: T201
 
     @property
     def characters(self):
@@ -346,7 +388,6 @@ class Save:
             return (False, [])
 
         fixes = []
-        from io import BytesIO
 
         # Fix 1: Torrent bug
         if slot.has_torrent_bug():
@@ -355,12 +396,7 @@ class Save:
                 horse.fix_bug()
 
                 if hasattr(slot, "horse_offset") and slot.horse_offset > 0:
-                    horse_bytes = BytesIO()
-                    horse.write(horse_bytes)
-                    horse_data = horse_bytes.getvalue()
-                    self._raw_data[
-                        slot.horse_offset : slot.horse_offset + len(horse_data)
-                    ] = horse_data
+                    horse.write(_RawWriter(self._raw_data, slot.horse_offset))
                     fixes.append(f"State changed to {horse.state.name}")
 
         # Fix 2: SteamId corruption
@@ -376,9 +412,7 @@ class Save:
 
                 # Write to file
                 if hasattr(slot, "steamid_offset") and slot.steamid_offset > 0:
-                    import struct
-
-                    steamid_bytes = struct.pack("<Q", correct_steam_id)
+                    steamid_bytes = U64.pack(correct_steam_id)
                     self._raw_data[slot.steamid_offset : slot.steamid_offset + 8] = (
                         steamid_bytes
                     )
@@ -418,12 +452,7 @@ class Save:
 
                         # Write to file
                         if hasattr(slot, "time_offset") and slot.time_offset > 0:
-                            time_bytes = BytesIO()
-                            time.write(time_bytes)
-                            time_data = time_bytes.getvalue()
-                            self._raw_data[
-                                slot.time_offset : slot.time_offset + len(time_data)
-                            ] = time_data
+                            time.write(_RawWriter(self._raw_data, slot.time_offset))
                             fixes.append(
                                 f"Time set to {hours:02d}:{minutes:02d}:{seconds:02d}"
                             )
@@ -437,12 +466,7 @@ class Save:
 
                 # Write to file
                 if hasattr(slot, "weather_offset") and slot.weather_offset > 0:
-                    weather_bytes = BytesIO()
-                    weather.write(weather_bytes)
-                    weather_data = weather_bytes.getvalue()
-                    self._raw_data[
-                        slot.weather_offset : slot.weather_offset + len(weather_data)
-                    ] = weather_data
+                    weather.write(_RawWriter(self._raw_data, slot.weather_offset))
                     fixes.append(f"AreaId set to {weather.area_id}")
 
         # Fix 5: Event flag corruption (Ranni quest + warp sickness)
@@ -542,12 +566,7 @@ class Save:
 
         # Write the cleared DLC struct back to raw data
         if hasattr(slot, "dlc_offset") and slot.dlc_offset > 0:
-            from io import BytesIO
-
-            dlc_bytes = BytesIO()
-            slot.dlc.write(dlc_bytes)
-            dlc_data = dlc_bytes.getvalue()
-            self._raw_data[slot.dlc_offset : slot.dlc_offset + len(dlc_data)] = dlc_data
+            slot.dlc.write(_RawWriter(self._raw_data, slot.dlc_offset))
             return True
 
         return False
@@ -580,17 +599,33 @@ class Save:
 
         # Write the cleared DLC struct back to raw data
         if hasattr(slot, "dlc_offset") and slot.dlc_offset > 0:
-            from io import BytesIO
-
-            dlc_bytes = BytesIO()
-            slot.dlc.write(dlc_bytes)
-            dlc_data = dlc_bytes.getvalue()
-            self._raw_data[slot.dlc_offset : slot.dlc_offset + len(dlc_data)] = dlc_data
+            slot.dlc.write(_RawWriter(self._raw_data, slot.dlc_offset))
             return True
 
         return False
 
 
+class _RawWriter:
+    """
+    Minimal file-like writer over a bytearray, starting at a fixed offset.
+
+    Lets a record's write() patch its bytes straight into the save buffer
+    instead of building them in a BytesIO and copying them over.
+    """
+
+    __slots__ = ("_buf", "_pos")
+
+    def __init__(self, buf: bytearray, offset: int):
+        self._buf = buf
+        self._pos = offset
+
+    def write(self, data: bytes) -> int:
+        end = self._pos + len(data)
+        self._buf[self._pos : end] = data
+        self._pos = end
+        return len(data)
+
+
 def load_save(filepath: str) -> Save:
     """
     Convenience function to load a save file.
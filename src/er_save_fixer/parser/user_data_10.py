@@ -9,18 +9,23 @@ Contains global save data including:
 
 from __future__ import annotations
 
-import struct
 from dataclasses import dataclass, field
-from io import BytesIO
+from io import SEEK_CUR, BytesIO
+from struct import Struct
 
+from ._structs import U32, U64
 
-def read_wstring(f: BytesIO, max_chars: int) -> str:
-    """Read a wide string (UTF-16LE) of max_chars characters"""
-    data = f.read(max_chars * 2)
-    return data.decode("utf-16le").rstrip("\x00")
+# ProfileSummary active flags, one bool byte per slot
+_ACTIVE_PROFILES = Struct("<10?")
+# Settings: 36 single-byte options, then unk0x24 (u64) and unk0x2c (u16)
+_SETTINGS = Struct("<36BQH")
+# Profile (0x24C bytes): character_name, 2-byte terminator, level,
+# seconds_played, runes_memory, map_id, unk0x34, face_data, equipment,
+# body_type, archetype, starting_gift and 7 unknown bytes
+_PROFILE = Struct("<32s2x3I4sI292s232s3B7x")
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     """Game settings"""
 
@@ -66,49 +71,10 @@ class Settings:
     @classmethod
     def read(cls, f: BytesIO) -> Settings:
         """Read Settings from stream"""
-        obj = cls()
-        obj.camera_speed = struct.unpack("<B", f.read(1))[0]
-        obj.controller_vibration = struct.unpack("<B", f.read(1))[0]
-        obj.brightness = struct.unpack("<B", f.read(1))[0]
-        obj.unk0x3 = struct.unpack("<B", f.read(1))[0]
-        obj.music_volume = struct.unpack("<B", f.read(1))[0]
-        obj.sound_effects_volume = struct.unpack("<B", f.read(1))[0]
-        obj.voice_volume = struct.unpack("<B", f.read(1))[0]
-        obj.display_blood = struct.unpack("<B", f.read(1))[0]
-        obj.subtitles = struct.unpack("<B", f.read(1))[0]
-        obj.hud = struct.unpack("<B", f.read(1))[0]
-        obj.camera_x_axis = struct.unpack("<B", f.read(1))[0]
-        obj.camera_y_axis = struct.unpack("<B", f.read(1))[0]
-        obj.toggle_auto_lockon = struct.unpack("<B", f.read(1))[0]
-        obj.camera_auto_wall_recovery = struct.unpack("<B", f.read(1))[0]
-        obj.unk0xe = struct.unpack("<B", f.read(1))[0]
-        obj.unk0xf = struct.unpack("<B", f.read(1))[0]
-        obj.reset_camera_y_axis = struct.unpack("<B", f.read(1))[0]
-        obj.cinematic_effects = struct.unpack("<B", f.read(1))[0]
-        obj.unk0x12 = struct.unpack("<B", f.read(1))[0]
-        obj.perform_matchmaking = struct.unpack("<B", f.read(1))[0]
-        obj.unk0x14 = struct.unpack("<B", f.read(1))[0]
-        obj.unk0x15 = struct.unpack("<B", f.read(1))[0]
-        obj.manual_attack_aim = struct.unpack("<B", f.read(1))[0]
-        obj.autotarget = struct.unpack("<B", f.read(1))[0]
-        obj.launchsettings = struct.unpack("<B", f.read(1))[0]
-        obj.send_summon_sign = struct.unpack("<B", f.read(1))[0]
-        obj.unk0x1a = struct.unpack("<B", f.read(1))[0]
-        obj.hdr = struct.unpack("<B", f.read(1))[0]
-        obj.hdr_adjust_brightness = struct.unpack("<B", f.read(1))[0]
-        obj.hdr_maximum_brightness = struct.unpack("<B", f.read(1))[0]
-        obj.hdr_adjust_saturation = struct.unpack("<B", f.read(1))[0]
-        obj.unk0x1f = struct.unpack("<B", f.read(1))[0]
-        obj.master_volume = struct.unpack("<B", f.read(1))[0]
-        obj.is_raytracing_on = struct.unpack("<B", f.read(1))[0]
-        obj.mark_new_items = struct.unpack("<B", f.read(1))[0]
-        obj.show_recent_tabs = struct.unpack("<B", f.read(1))[0]
-        obj.unk0x24 = struct.unpack("<Q", f.read(8))[0]
-        obj.unk0x2c = struct.unpack("<H", f.read(2))[0]
-        return obj
+        return cls(*_SETTINGS.unpack(f.read(_SETTINGS.size)))
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileEquipment:
     """Equipment info in profile summary"""
 
@@ -122,7 +88,7 @@ class ProfileEquipment:
         return obj
 
 
-@dataclass
+@dataclass(slots=True)
 class Profile:
     """Profile data for a single character slot in ProfileSummary"""
 
@@ -141,39 +107,36 @@ class Profile:
     @classmethod
     def read(cls, f: BytesIO) -> Profile:
         """Read Profile from stream - 0x24C bytes total"""
-        obj = cls()
-
-        # Character name (16 wide chars)
-        obj.character_name = read_wstring(f, 16)
-
-        # Terminator (2 bytes)
-        f.read(2)
-
-        # Stats
-        obj.level = struct.unpack("<I", f.read(4))[0]
-        obj.seconds_played = struct.unpack("<I", f.read(4))[0]
-        obj.runes_memory = struct.unpack("<I", f.read(4))[0]
-        obj.map_id = f.read(4)
-        obj.unk0x34 = struct.unpack("<I", f.read(4))[0]
-
-        # Face data (0x124 bytes)
-        obj.face_data = f.read(0x124)
-
-        # Equipment (0xE8 bytes)
-        obj.equipment = ProfileEquipment.read(f)
-
-        # Character creation data
-        obj.body_type = struct.unpack("<B", f.read(1))[0]
-        obj.archetype = struct.unpack("<B", f.read(1))[0]
-        obj.starting_gift = struct.unpack("<B", f.read(1))[0]
-
-        # Unknown fields (3 bytes + 4 bytes = 7 bytes total)
-        f.read(7)
-
-        return obj
-
-
-@dataclass
+        (
+            name,
+            level,
+            seconds_played,
+            runes_memory,
+            map_id,
+            unk0x34,
+            face_data,
+            equipment,
+            body_type,
+            archetype,
+            starting_gift,
+        ) = _PROFILE.unpack(f.read(_PROFILE.size))
+        return cls(
+            # Character name (16 wide chars)
+            character_name=name.decode("utf-16le").rstrip("\x00"),
+            level=level,
+            seconds_played=seconds_played,
+            runes_memory=runes_memory,
+            map_id=map_id,
+            unk0x34=unk0x34,
+            face_data=face_data,
+            equipment=ProfileEquipment(equipment),
+            body_type=body_type,
+            archetype=archetype,
+            starting_gift=starting_gift,
+        )
+
+
+@dataclass(slots=True)
 class ProfileSummary:
     """Profile summary containing basic info for all 10 character slots"""
 
@@ -186,9 +149,7 @@ class ProfileSummary:
         obj = cls()
 
         # Active profiles (10 bytes)
-        obj.active_profiles = [
-            bool(struct.unpack("<B", f.read(1))[0]) for _ in range(10)
-        ]
+        obj.active_profiles = list(_ACTIVE_PROFILES.unpack(f.read(10)))
 
         # 10 profiles
         obj.profiles = [Profile.read(f) for _ in range(10)]
@@ -196,7 +157,7 @@ class ProfileSummary:
         return obj
 
 
-@dataclass
+@dataclass(slots=True)
 class MenuSystemSaveLoad:
     """Menu system data - just read as raw for now"""
 
@@ -210,7 +171,7 @@ class MenuSystemSaveLoad:
         return obj
 
 
-@dataclass
+@dataclass(slots=True)
 class PCOptionData:
     """PC-specific options - just read as raw"""
 
@@ -224,7 +185,7 @@ class PCOptionData:
         return obj
 
 
-@dataclass
+@dataclass(slots=True)
 class KeyConfigSaveLoad:
     """Key configuration data"""
 
@@ -235,13 +196,13 @@ class KeyConfigSaveLoad:
     def read(cls, f: BytesIO) -> KeyConfigSaveLoad:
         """Read KeyConfigSaveLoad"""
         obj = cls()
-        f.read(4)  # Skip unk0x0, unk0x2
-        obj.size = struct.unpack("<I", f.read(4))[0]
+        f.seek(4, SEEK_CUR)  # Skip unk0x0, unk0x2
+        obj.size = U32.unpack(f.read(4))[0]
         obj.data = f.read(obj.size)
         return obj
 
 
-@dataclass
+@dataclass(slots=True)
 class UserData10:
     """
     USER_DATA_10 - Common section with global save data
@@ -275,13 +236,13 @@ class UserData10:
 
         # Skip checksum on PC
         if not is_ps:
-            f.read(16)
+            f.seek(16, SEEK_CUR)
 
         # Version (4 bytes)
-        obj.version = struct.unpack("<I", f.read(4))[0]
+        obj.version = U32.unpack(f.read(4))[0]
 
         # SteamID (8 bytes)
-        obj.steam_id = struct.unpack("<Q", f.read(8))[0]
+        obj.steam_id = U64.unpack(f.read(8))[0]
 
         # Settings (0x140 bytes based on CSV)
         # Actually Settings is smaller but includes padding
@@ -291,7 +252,7 @@ class UserData10:
         settings_expected_end = start_pos + (16 if not is_ps else 0) + 4 + 8 + 0x140
         padding = settings_expected_end - settings_end
         if padding > 0:
-            f.read(padding)
+            f.seek(padding, SEEK_CUR)
 
         # MenuSystemSaveLoad (0x1808 bytes)
         obj.menu_system_save_load = MenuSystemSaveLoad.read(f)
@@ -300,7 +261,7 @@ class UserData10:
         obj.profile_summary = ProfileSummary.read(f)
 
         # gamedataman fields (5 bytes)
-        f.read(5)
+        f.seek(5, SEEK_CUR)
 
         # PCOptionData (PC only, 0xB2 bytes)
         if not is_ps:
@@ -310,12 +271,12 @@ class UserData10:
         obj.key_config_save_load = KeyConfigSaveLoad.read(f)
 
         # game_man_0x118 (8 bytes)
-        f.read(8)
+        f.seek(8, SEEK_CUR)
 
         # Skip rest
         bytes_read = f.tell() - start_pos
         remaining = 0x60000 - bytes_read
         if remaining > 0:
-            f.read(remaining)
+            f.seek(remaining, SEEK_CUR)
 
         return obj
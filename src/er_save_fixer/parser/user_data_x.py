@@ -7,10 +7,12 @@ Based on ER-Save-Lib Rust implementation - exact field order.
 
 from __future__ import annotations
 
-import struct
 from dataclasses import dataclass, field
 from io import BytesIO
+from itertools import accumulate
+from struct import Struct
 
+from ._structs import U32, U64
 from .character import PlayerGameData, SPEffect
 from .equipment import (
     AcquiredProjectiles,
@@ -26,7 +28,7 @@ from .equipment import (
     Inventory,
     TrophyEquipData,
 )
-from .er_types import Gaitem, MapId
+from .er_types import GaitemMap, MapId, read_fixed_array
 from .world import (
     DLC,
     BaseVersion,
@@ -50,8 +52,25 @@ from .world import (
     WorldGeomMan,
 )
 
+# Gaitem map entry count by slot version (<= 81 / newer)
+_GAITEM_COUNT_OLD = 0x13FE  # 5118
+_GAITEM_COUNT = 0x1400  # 5120
 
-@dataclass
+# Contiguous scalar runs in the slot tail, read with one unpack each
+# control_byte_maybe is followed by BloodStain, so it stays a lone U8
+_SCALARS_AFTER_BLOOD_STAIN = Struct("<II")
+# gameman_0x8c .. unk_gamedataman_0x124_or_gamedataman_0x134
+_SCALARS_AFTER_TUTORIAL = Struct("<BBBIiBIIBII")
+# 2 bytes padding, spawn_point_entity_id, game_man_0xb64
+_SCALARS_AFTER_COORDINATES = Struct("<2xII")
+
+# First 64 bytes of a gesture candidate chunk, as 16 gesture ids
+_GESTURE_ID_PROBE = Struct("<16I")
+# bytes.translate table mapping 0xFF to 1 and every other byte to 0
+_FF_ONLY = bytes(255) + b"\x01"
+
+
+@dataclass(slots=True)
 class UserDataX:
     """
     Complete character slot (UserDataX structure)
@@ -67,14 +86,15 @@ class UserDataX:
     time_offset: int = 0
     steamid_offset: int = 0
     dlc_offset: int = 0
+    event_flags_offset: int = 0
     # Header (4 + 4 + 8 + 16 = 32 bytes)
     version: int = 0
     map_id: MapId = field(default_factory=MapId)
-    unk0x8: bytes = field(default_factory=lambda: b"\x00" * 8)
-    unk0x10: bytes = field(default_factory=lambda: b"\x00" * 16)
+    unk0x8: bytes = bytes(8)
+    unk0x10: bytes = bytes(16)
 
     # Gaitem map (VARIABLE LENGTH! 5118 or 5120 entries)
-    gaitem_map: list[Gaitem] = field(default_factory=list)
+    gaitem_map: GaitemMap = field(default_factory=GaitemMap)
 
     # Player data (0x1B0 = 432 bytes)
     player_game_data: PlayerGameData = field(default_factory=PlayerGameData)
@@ -155,8 +175,9 @@ class UserDataX:
     in_game_countdown_timer: int = 0
     unk_gamedataman_0x124_or_gamedataman_0x134: int = 0
 
-    # Event flags (0x1BF99F = 1,833,375 bytes)
-    event_flags: bytes = field(default_factory=lambda: b"\x00" * 0x1BF99F)
+    # Event flags (0x1BF99F = 1,833,375 bytes once read; empty for an
+    # unread/empty slot, so constructing a placeholder costs nothing)
+    event_flags: bytes | memoryview = b""
     event_flags_terminator: int = 0
 
     # World structures
@@ -189,8 +210,8 @@ class UserDataX:
     dlc: DLC = field(default_factory=DLC)
     player_data_hash: PlayerGameDataHash = field(default_factory=PlayerGameDataHash)
 
-    # Any remaining bytes
-    rest: bytes = b""
+    # Any remaining bytes (~420KB)
+    rest: bytes | memoryview = b""
 
     @classmethod
     def _find_gesture_start(
@@ -202,19 +223,26 @@ class UserDataX:
         search_start = max(start_pos - 1000, 0)
         search_end = min(start_pos + 2000, max_pos - 512)
 
+        # One read covers every 256-byte candidate chunk in the range
+        f.seek(search_start)
+        window = f.read(max(search_end - search_start, 0) + 256)
+        f.seek(original_pos)
+
+        # Prefix sums of 0xFF bytes, so each chunk's count is one subtraction
+        ff_prefix = list(accumulate(window.translate(_FF_ONLY), initial=0))
+
         best_match = None
         best_score = 0
 
-        for offset in range(search_start, search_end, 4):
-            f.seek(offset)
-            chunk = f.read(256)
-            if len(chunk) < 256:
-                continue
+        for rel in range(0, search_end - search_start, 4):
+            if rel + 256 > len(window):
+                # Short chunk at EOF, and every later one is shorter still
+                break
 
             score = 0
 
             # Pattern 1: VERY high 0xFF density (bitmask gestures)
-            ff_count = chunk.count(0xFF)
+            ff_count = ff_prefix[rel + 256] - ff_prefix[rel]
             if ff_count > 220:  # Very strict - need 85%+ 0xFF
                 score = 100
             elif ff_count > 180:  # Medium match
@@ -223,15 +251,13 @@ class UserDataX:
             # Pattern 2: Gesture ID validation (must be consecutive and valid)
             consecutive_valid = 0
             max_consecutive = 0
-            for i in range(0, 64, 4):
-                if i + 4 <= len(chunk):
-                    val = struct.unpack("<I", chunk[i : i + 4])[0]
-                    # Very strict gesture ID ranges
-                    if val == 0 or val == 0xFFFFFFFE or (3000000 <= val <= 9000000):
-                        consecutive_valid += 1
-                        max_consecutive = max(max_consecutive, consecutive_valid)
-                    else:
-                        consecutive_valid = 0
+            for val in _GESTURE_ID_PROBE.unpack_from(window, rel):
+                # Very strict gesture ID ranges
+                if val == 0 or val == 0xFFFFFFFE or (3000000 <= val <= 9000000):
+                    consecutive_valid += 1
+                    max_consecutive = max(max_consecutive, consecutive_valid)
+                else:
+                    consecutive_valid = 0
 
             if max_consecutive >= 12:  # Need 12+ consecutive valid IDs
                 score = max(score, 80)
@@ -241,9 +267,7 @@ class UserDataX:
             # Track best match
             if score > best_score:
                 best_score = score
-                best_match = offset
-
-        f.seek(original_pos)
+                best_match = search_start + rel
 
         # Only return if we have a STRONG match (score >= 80)
         if best_score >= 80 and best_match is not None:
@@ -254,7 +278,12 @@ class UserDataX:
 
     @classmethod
     def read(
-        cls, f: BytesIO, is_ps: bool, slot_start_offset: int, slot_size: int
+        cls,
+        f: BytesIO,
+        is_ps: bool,
+        slot_start_offset: int,
+        slot_size: int,
+        source: bytes | None = None,
     ) -> UserDataX:
         """
         Read complete UserDataX from stream with robust error handling.
@@ -267,6 +296,11 @@ class UserDataX:
             is_ps: True if PlayStation format (no checksum)
             slot_start_offset: Absolute file offset where slot data starts (after checksum)
             slot_size: Total size of slot data (0x280000 = 2,621,440 bytes)
+            source: The bytes backing `f`, if available. event_flags,
+                net_man.data and rest are then read-only memoryviews into it
+                instead of copies (1.8MB, 128KB and ~420KB). The views keep
+                `source` alive for as long as the slot is; use bytes(...)
+                for a standalone copy. Without `source` they are bytes
 
         Returns:
             UserDataX instance with all fields populated
@@ -276,15 +310,12 @@ class UserDataX:
         data_start = f.tell()  # Track where we started reading
 
         # Read version (4 bytes)
-        obj.version = struct.unpack("<I", f.read(4))[0]
+        obj.version = U32.unpack(f.read(4))[0]
 
         # Empty slot check
         if obj.version == 0:
-            # Read rest of slot to maintain alignment
-            bytes_read = f.tell() - data_start
-            remaining = slot_size - bytes_read
-            if remaining > 0:
-                f.read(remaining)
+            # Seek to the end of the slot to maintain alignment (no copy)
+            f.seek(data_start + slot_size)
             return obj
 
         # Read map_id and header (4 + 8 + 16 = 28 bytes)
@@ -293,14 +324,16 @@ class UserDataX:
         obj.unk0x10 = f.read(16)
 
         # Read Gaitem map (VARIABLE LENGTH!)
-        gaitem_count = 0x13FE if obj.version <= 81 else 0x1400  # 5118 or 5120
-        obj.gaitem_map = [Gaitem.read(f) for _ in range(gaitem_count)]
+        gaitem_count = _GAITEM_COUNT_OLD if obj.version <= 81 else _GAITEM_COUNT
+        obj.gaitem_map = GaitemMap.read(f, gaitem_count)
 
         # Read player game data (432 bytes)
         obj.player_game_data = PlayerGameData.read(f)
 
         # Read SP effects (13 entries)
-        obj.sp_effects = [SPEffect.read(f) for _ in range(13)]
+        obj.sp_effects = [
+            SPEffect(*t) for t in read_fixed_array(f, SPEffect._STRUCT, 13)
+        ]
 
         # Read equipment structures
         obj.equipped_items_equip_index = EquippedItemsEquipIndex.read(f)
@@ -333,12 +366,12 @@ class UserDataX:
         obj.horse_offset = f.tell()
         obj.horse_offset = f.tell()
         obj.horse = RideGameData.read(f)
-        obj.control_byte_maybe = struct.unpack("<B", f.read(1))[0]
+        obj.control_byte_maybe = f.read(1)[0]
         obj.blood_stain = BloodStain.read(f)
-        obj.unk_gamedataman_0x120_or_gamedataman_0x130 = struct.unpack("<I", f.read(4))[
-            0
-        ]
-        obj.unk_gamedataman_0x88 = struct.unpack("<I", f.read(4))[0]
+        (
+            obj.unk_gamedataman_0x120_or_gamedataman_0x130,
+            obj.unk_gamedataman_0x88,
+        ) = _SCALARS_AFTER_BLOOD_STAIN.unpack(f.read(_SCALARS_AFTER_BLOOD_STAIN.size))
 
         try:
             obj.menu_profile_save_load = MenuSaveLoad.read(f)
@@ -348,24 +381,28 @@ class UserDataX:
         except Exception:
             raise
 
-        obj.gameman_0x8c = struct.unpack("<B", f.read(1))[0]
-        obj.gameman_0x8d = struct.unpack("<B", f.read(1))[0]
-        obj.gameman_0x8e = struct.unpack("<B", f.read(1))[0]
-
-        obj.total_deaths_count = struct.unpack("<I", f.read(4))[0]
-        obj.character_type = struct.unpack("<i", f.read(4))[0]
-        obj.in_online_session_flag = struct.unpack("<B", f.read(1))[0]
-        obj.character_type_online = struct.unpack("<I", f.read(4))[0]
-        obj.last_rested_grace = struct.unpack("<I", f.read(4))[0]
-        obj.not_alone_flag = struct.unpack("<B", f.read(1))[0]
-        obj.in_game_countdown_timer = struct.unpack("<I", f.read(4))[0]
-        obj.unk_gamedataman_0x124_or_gamedataman_0x134 = struct.unpack("<I", f.read(4))[
-            0
-        ]
-
-        obj.event_flags_offset = f.tell()
-        obj.event_flags = f.read(0x1BF99F)
-        obj.event_flags_terminator = struct.unpack("<B", f.read(1))[0]
+        (
+            obj.gameman_0x8c,
+            obj.gameman_0x8d,
+            obj.gameman_0x8e,
+            obj.total_deaths_count,
+            obj.character_type,
+            obj.in_online_session_flag,
+            obj.character_type_online,
+            obj.last_rested_grace,
+            obj.not_alone_flag,
+            obj.in_game_countdown_timer,
+            obj.unk_gamedataman_0x124_or_gamedataman_0x134,
+        ) = _SCALARS_AFTER_TUTORIAL.unpack(f.read(_SCALARS_AFTER_TUTORIAL.size))
+
+        flags_pos = f.tell()
+        obj.event_flags_offset = flags_pos
+        if source is not None:
+            obj.event_flags = memoryview(source)[flags_pos : flags_pos + 0x1BF99F]
+            f.seek(flags_pos + 0x1BF99F)
+        else:
+            obj.event_flags = f.read(0x1BF99F)
+        obj.event_flags_terminator = f.read(1)[0]
         # There are 16 more bytes after the terminator
 
         obj.field_area = FieldArea.read(f)
@@ -375,24 +412,18 @@ class UserDataX:
         obj.rend_man = RendMan.read(f)
         obj.player_coordinates = PlayerCoordinates.read(f)
 
-        # 2 bytes padding after PlayerCoordinates
-        f.read(2)
-        obj.spawn_point_entity_id = struct.unpack("<I", f.read(4))[0]
-        # 4 bytes padding
-        obj.game_man_0xb64 = struct.unpack("<I", f.read(4))[0]
+        # 2 bytes padding after PlayerCoordinates, then the spawn point ids
+        (
+            obj.spawn_point_entity_id,
+            obj.game_man_0xb64,
+        ) = _SCALARS_AFTER_COORDINATES.unpack(f.read(_SCALARS_AFTER_COORDINATES.size))
 
         if obj.version >= 65:
-            obj.temp_spawn_point_entity_id = struct.unpack("<I", f.read(4))[0]
+            obj.temp_spawn_point_entity_id = U32.unpack(f.read(4))[0]
         if obj.version >= 66:
-            obj.game_man_0xcb3 = struct.unpack("<B", f.read(1))[0]
-
-        obj.net_man = NetMan.read(f)
+            obj.game_man_0xcb3 = f.read(1)[0]
 
-        # DIAGNOSTIC: Show exact position and bytes
-        current_pos = f.tell()
-        current_pos + 0x300
-        f.read(24)
-        f.seek(current_pos)
+        obj.net_man = NetMan.read(f, source)
 
         obj.weather_offset = f.tell()
         obj.world_area_weather = WorldAreaWeather.read(f)
@@ -400,7 +431,7 @@ class UserDataX:
         obj.world_area_time = WorldAreaTime.read(f)
         obj.base_version = BaseVersion.read(f)
         obj.steamid_offset = f.tell()
-        obj.steam_id = struct.unpack("<Q", f.read(8))[0]
+        obj.steam_id = U64.unpack(f.read(8))[0]
         obj.ps5_activity = PS5Activity.read(f)
         obj.dlc_offset = f.tell()
         obj.dlc = DLC.read(f)
@@ -416,7 +447,11 @@ class UserDataX:
         elif current_position < slot_end_position:
             # read them as rest
             remaining = slot_end_position - current_position
-            obj.rest = f.read(remaining)
+            if source is not None:
+                obj.rest = memoryview(source)[current_position:slot_end_position]
+                f.seek(slot_end_position)
+            else:
+                obj.rest = f.read(remaining)
 
         return obj
 
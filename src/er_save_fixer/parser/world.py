@@ -11,14 +11,26 @@ import struct
 from dataclasses import dataclass, field
 from io import BytesIO
 
-from .er_types import FloatVector3, FloatVector4, HorseState, MapId
+from ._structs import I32, I64, U32
+from .er_types import (
+    FloatVector3,
+    FloatVector4,
+    HorseState,
+    MapId,
+    PackedRecords,
+    read_u32_list,
+    write_u32_list,
+)
+
+# unk0x0, unk0x2 and size header shared by the size-prefixed menu blocks
+_SIZED_BLOCK_HEADER = struct.Struct("<HHI")
 
 # ============================================================================
 # FACE DATA - Character appearance customization
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class FaceData:
     """
     Character appearance and body customization (0x12F = 303 bytes when in_profile_summary=False)
@@ -27,7 +39,7 @@ class FaceData:
     Stored as raw bytes for simplicity - can be expanded to individual fields if needed.
     """
 
-    raw_data: bytes = field(default_factory=lambda: b"\x00" * 0x12F)
+    raw_data: bytes = bytes(0x12F)
 
     @classmethod
     def read(cls, f: BytesIO, in_profile_summary: bool = False) -> FaceData:
@@ -54,7 +66,7 @@ class FaceData:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Gestures:
     """All gesture IDs (variable size based on version)"""
 
@@ -63,28 +75,21 @@ class Gestures:
     @classmethod
     def read(cls, f: BytesIO) -> Gestures:
         """Read Gestures from stream (256 bytes = 64 u32s)"""
-        start_pos = f.tell()
-        result = cls.read_with_count(f, 64)
-        end_pos = f.tell()
-        bytes_read = end_pos - start_pos
-        if bytes_read != 256:
-            pass
-        return result
+        return cls.read_with_count(f, 64)
 
     @classmethod
     def read_with_count(cls, f: BytesIO, count: int) -> Gestures:
         """Read Gestures with specified count"""
         obj = cls()
-        obj.gesture_ids = [struct.unpack("<I", f.read(4))[0] for _ in range(count)]
+        obj.gesture_ids = read_u32_list(f, count)
         return obj
 
     def write(self, f: BytesIO):
         """Write Gestures to stream"""
-        for gesture_id in self.gesture_ids:
-            f.write(struct.pack("<I", gesture_id))
+        write_u32_list(f, self.gesture_ids)
 
 
-@dataclass
+@dataclass(slots=True)
 class Regions:
     """
     Unlocked regions (variable size based on count)
@@ -99,17 +104,16 @@ class Regions:
     def read(cls, f: BytesIO) -> Regions:
         """Read Regions from stream (variable size based on count)"""
         obj = cls()
-        obj.count = struct.unpack("<I", f.read(4))[0]
-        obj.region_ids = [struct.unpack("<I", f.read(4))[0] for _ in range(obj.count)]
+        obj.count = U32.unpack(f.read(4))[0]
+        obj.region_ids = read_u32_list(f, obj.count)
         return obj
 
         return obj
 
     def write(self, f: BytesIO):
         """Write Regions to stream"""
-        f.write(struct.pack("<I", self.count))
-        for region_id in self.region_ids:
-            f.write(struct.pack("<I", region_id))
+        f.write(U32.pack(self.count))
+        write_u32_list(f, self.region_ids)
 
 
 # ============================================================================
@@ -117,7 +121,7 @@ class Regions:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class RideGameData:
     """
     Torrent/Horse data (0x28 = 40 bytes)
@@ -131,24 +135,38 @@ class RideGameData:
     hp: int = 0
     state: HorseState = HorseState.INACTIVE
 
+    # coordinates, map_id, angle, hp, state
+    _STRUCT = struct.Struct("<3f4s4fiI")
+
     @classmethod
     def read(cls, f: BytesIO) -> RideGameData:
         """Read RideGameData from stream (40 bytes)"""
+        v = cls._STRUCT.unpack(f.read(cls._STRUCT.size))
         return cls(
-            coordinates=FloatVector3.read(f),
-            map_id=MapId.read(f),
-            angle=FloatVector4.read(f),
-            hp=struct.unpack("<i", f.read(4))[0],
-            state=HorseState(struct.unpack("<I", f.read(4))[0]),
+            coordinates=FloatVector3(v[0], v[1], v[2]),
+            map_id=MapId(v[3]),
+            angle=FloatVector4(v[4], v[5], v[6], v[7]),
+            hp=v[8],
+            state=HorseState(v[9]),
         )
 
     def write(self, f: BytesIO):
         """Write RideGameData to stream (40 bytes)"""
-        self.coordinates.write(f)
-        self.map_id.write(f)
-        self.angle.write(f)
-        f.write(struct.pack("<i", self.hp))
-        f.write(struct.pack("<I", int(self.state)))
+        c, a = self.coordinates, self.angle
+        f.write(
+            self._STRUCT.pack(
+                c.x,
+                c.y,
+                c.z,
+                self.map_id.data,
+                a.x,
+                a.y,
+                a.z,
+                a.w,
+                self.hp,
+                int(self.state),
+            )
+        )
 
     def has_bug(self) -> bool:
         """
@@ -173,7 +191,7 @@ class RideGameData:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class BloodStain:
     """Death bloodstain data (0x44 = 68 bytes)"""
 
@@ -190,38 +208,53 @@ class BloodStain:
     unk0x3c: int = 0
     unk0x38: int = 0
 
+    # coordinates, angle, unk0x1c..unk0x2c, unk0x30, runes, map_id,
+    # unk0x3c, unk0x38
+    _STRUCT = struct.Struct("<3f4f5I2i4s2I")
+
     @classmethod
     def read(cls, f: BytesIO) -> BloodStain:
         """Read BloodStain from stream (68 bytes)"""
+        v = cls._STRUCT.unpack(f.read(cls._STRUCT.size))
         return cls(
-            coordinates=FloatVector3.read(f),
-            angle=FloatVector4.read(f),
-            unk0x1c=struct.unpack("<I", f.read(4))[0],
-            unk0x20=struct.unpack("<I", f.read(4))[0],
-            unk0x24=struct.unpack("<I", f.read(4))[0],
-            unk0x28=struct.unpack("<I", f.read(4))[0],
-            unk0x2c=struct.unpack("<I", f.read(4))[0],
-            unk0x30=struct.unpack("<i", f.read(4))[0],
-            runes=struct.unpack("<i", f.read(4))[0],
-            map_id=MapId.read(f),
-            unk0x3c=struct.unpack("<I", f.read(4))[0],
-            unk0x38=struct.unpack("<I", f.read(4))[0],
+            coordinates=FloatVector3(v[0], v[1], v[2]),
+            angle=FloatVector4(v[3], v[4], v[5], v[6]),
+            unk0x1c=v[7],
+            unk0x20=v[8],
+            unk0x24=v[9],
+            unk0x28=v[10],
+            unk0x2c=v[11],
+            unk0x30=v[12],
+            runes=v[13],
+            map_id=MapId(v[14]),
+            unk0x3c=v[15],
+            unk0x38=v[16],
         )
 
     def write(self, f: BytesIO):
         """Write BloodStain to stream (68 bytes)"""
-        self.coordinates.write(f)
-        self.angle.write(f)
-        f.write(struct.pack("<I", self.unk0x1c))
-        f.write(struct.pack("<I", self.unk0x20))
-        f.write(struct.pack("<I", self.unk0x24))
-        f.write(struct.pack("<I", self.unk0x28))
-        f.write(struct.pack("<I", self.unk0x2c))
-        f.write(struct.pack("<i", self.unk0x30))
-        f.write(struct.pack("<i", self.runes))
-        self.map_id.write(f)
-        f.write(struct.pack("<I", self.unk0x3c))
-        f.write(struct.pack("<I", self.unk0x38))
+        c, a = self.coordinates, self.angle
+        f.write(
+            self._STRUCT.pack(
+                c.x,
+                c.y,
+                c.z,
+                a.x,
+                a.y,
+                a.z,
+                a.w,
+                self.unk0x1c,
+                self.unk0x20,
+                self.unk0x24,
+                self.unk0x28,
+                self.unk0x2c,
+                self.unk0x30,
+                self.runes,
+                self.map_id.data,
+                self.unk0x3c,
+                self.unk0x38,
+            )
+        )
 
 
 # ============================================================================
@@ -229,7 +262,7 @@ class BloodStain:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class MenuSaveLoad:
     """Menu profile save/load data (variable size based on size field)"""
 
@@ -241,10 +274,7 @@ class MenuSaveLoad:
     @classmethod
     def read(cls, f: BytesIO) -> MenuSaveLoad:
         """Read MenuSaveLoad from stream"""
-        obj = cls()
-        obj.unk0x0 = struct.unpack("<H", f.read(2))[0]
-        obj.unk0x2 = struct.unpack("<H", f.read(2))[0]
-        obj.size = struct.unpack("<I", f.read(4))[0]
+        obj = cls(*_SIZED_BLOCK_HEADER.unpack(f.read(8)))
 
         # Validate size to prevent reading corrupted data
         # MenuSaveLoad is always 0x1008 bytes total (header 8 + data 0x1000)
@@ -256,9 +286,7 @@ class MenuSaveLoad:
 
     def write(self, f: BytesIO):
         """Write MenuSaveLoad to stream"""
-        f.write(struct.pack("<H", self.unk0x0))
-        f.write(struct.pack("<H", self.unk0x2))
-        f.write(struct.pack("<I", self.size))
+        f.write(_SIZED_BLOCK_HEADER.pack(self.unk0x0, self.unk0x2, self.size))
         f.write(self.data)
 
 
@@ -267,9 +295,11 @@ class MenuSaveLoad:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GaitemGameDataEntry:
-    """Single gaitem game data entry (16 bytes with padding)"""
+    """Single gaitem game data entry (16 bytes with padding, immutable)"""
+
+    _STRUCT = struct.Struct("<IB3xIB3x")
 
     id: int = 0
     unk0x4: int = 0
@@ -279,45 +309,46 @@ class GaitemGameDataEntry:
     @classmethod
     def read(cls, f: BytesIO) -> GaitemGameDataEntry:
         """Read GaitemGameDataEntry from stream (16 bytes)"""
-        obj = cls()
-        obj.id = struct.unpack("<I", f.read(4))[0]
-        obj.unk0x4 = struct.unpack("<B", f.read(1))[0]
-        f.read(3)  # padding
-        obj.next_item_id = struct.unpack("<I", f.read(4))[0]
-        obj.unk0xc = struct.unpack("<B", f.read(1))[0]
-        f.read(3)  # padding
-        return obj
+        return cls(*cls._STRUCT.unpack(f.read(cls._STRUCT.size)))
 
     def write(self, f: BytesIO):
         """Write GaitemGameDataEntry to stream (16 bytes)"""
-        f.write(struct.pack("<I", self.id))
-        f.write(struct.pack("<B", self.unk0x4))
-        f.write(b"\x00" * 3)  # padding
-        f.write(struct.pack("<I", self.next_item_id))
-        f.write(struct.pack("<B", self.unk0xc))
-        f.write(b"\x00" * 3)  # padding
+        f.write(self._STRUCT.pack(self.id, self.unk0x4, self.next_item_id, self.unk0xc))
+
+
+class GaitemGameDataEntries(PackedRecords):
+    """
+    The 7000 GaitemGameDataEntry records, decoded on access
+
+    Entries are frozen snapshots: assign back a changed copy, e.g.
+    entries[i] = replace(entries[i], next_item_id=x). There are always
+    7000 entries; use materialize() for a plain list.
+    """
 
+    __slots__ = ()
 
-@dataclass
+    _RECORD = GaitemGameDataEntry
+
+
+@dataclass(slots=True)
 class GaitemGameData:
     """Gaitem game data (8 bytes + 7000 entries x 16 bytes = 0x1B458 bytes total)"""
 
     count: int = 0
-    entries: list[GaitemGameDataEntry] = field(default_factory=list)
+    entries: GaitemGameDataEntries = field(default_factory=GaitemGameDataEntries)
 
     @classmethod
     def read(cls, f: BytesIO) -> GaitemGameData:
         """Read GaitemGameData from stream"""
         obj = cls()
-        obj.count = struct.unpack("<q", f.read(8))[0]  # i64
-        obj.entries = [GaitemGameDataEntry.read(f) for _ in range(7000)]
+        obj.count = I64.unpack(f.read(8))[0]  # i64
+        obj.entries = GaitemGameDataEntries.read(f, 7000)
         return obj
 
     def write(self, f: BytesIO):
         """Write GaitemGameData to stream"""
-        f.write(struct.pack("<q", self.count))
-        for entry in self.entries:
-            entry.write(f)
+        f.write(I64.pack(self.count))
+        self.entries.write(f)
 
 
 # ============================================================================
@@ -325,7 +356,7 @@ class GaitemGameData:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class TutorialDataChunk:
     """Tutorial data chunk (variable size)"""
 
@@ -336,25 +367,22 @@ class TutorialDataChunk:
     def read(cls, f: BytesIO, total_size: int) -> TutorialDataChunk:
         """Read TutorialDataChunk from stream"""
         obj = cls()
-        obj.count = struct.unpack("<I", f.read(4))[0]
+        obj.count = U32.unpack(f.read(4))[0]
 
         # Read remaining data based on total_size (not based on count)
         num_ids = (total_size - 4) // 4
         if num_ids > 0:
-            obj.tutorial_ids = [
-                struct.unpack("<I", f.read(4))[0] for _ in range(num_ids)
-            ]
+            obj.tutorial_ids = read_u32_list(f, num_ids)
 
         return obj
 
     def write(self, f: BytesIO):
         """Write TutorialDataChunk to stream"""
-        f.write(struct.pack("<I", self.count))
-        for tutorial_id in self.tutorial_ids:
-            f.write(struct.pack("<I", tutorial_id))
+        f.write(U32.pack(self.count))
+        write_u32_list(f, self.tutorial_ids)
 
 
-@dataclass
+@dataclass(slots=True)
 class TutorialData:
     """Tutorial completion data (variable size based on size field)"""
 
@@ -366,10 +394,7 @@ class TutorialData:
     @classmethod
     def read(cls, f: BytesIO) -> TutorialData:
         """Read TutorialData from stream"""
-        obj = cls()
-        obj.unk0x0 = struct.unpack("<H", f.read(2))[0]
-        obj.unk0x2 = struct.unpack("<H", f.read(2))[0]
-        obj.size = struct.unpack("<I", f.read(4))[0]
+        obj = cls(*_SIZED_BLOCK_HEADER.unpack(f.read(8)))
 
         # Validate size
         if obj.size > 0x10000 or obj.size < 0:
@@ -381,9 +406,7 @@ class TutorialData:
 
     def write(self, f: BytesIO):
         """Write TutorialData to stream"""
-        f.write(struct.pack("<H", self.unk0x0))
-        f.write(struct.pack("<H", self.unk0x2))
-        f.write(struct.pack("<I", self.size))
+        f.write(_SIZED_BLOCK_HEADER.pack(self.unk0x0, self.unk0x2, self.size))
         self.data.write(f)
 
 
@@ -392,7 +415,7 @@ class TutorialData:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldArea:
     """Field area data (variable size based on size field)"""
 
@@ -403,7 +426,7 @@ class FieldArea:
     def read(cls, f: BytesIO) -> FieldArea:
         """Read FieldArea from stream"""
         obj = cls()
-        obj.size = struct.unpack("<i", f.read(4))[0]
+        obj.size = I32.unpack(f.read(4))[0]
 
         # Size field indicates how many DATA bytes to read (NOT including the size field itself)
         if obj.size > 0 and obj.size < 0x10000:
@@ -417,7 +440,7 @@ class FieldArea:
 
     def write(self, f: BytesIO):
         """Write FieldArea to stream"""
-        f.write(struct.pack("<i", self.size))
+        f.write(I32.pack(self.size))
         if self.size > 4:
             f.write(self.data)
 
@@ -427,7 +450,7 @@ class FieldArea:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class WorldBlockChrData:
     """World block character data (variable size)"""
 
@@ -437,22 +460,24 @@ class WorldBlockChrData:
     unk0xc: int = 0
     data: bytes = b""
 
+    # magic, map_id, size, unk0xc
+    _HEADER = struct.Struct("<4s4siI")
+
     @classmethod
     def read(cls, f: BytesIO) -> WorldBlockChrData:
         """Read WorldBlockChrData from stream"""
         obj = cls()
 
         # Read header (16 bytes total)
-        magic_bytes = f.read(4)
-        if len(magic_bytes) < 4:
+        header = f.read(cls._HEADER.size)
+        if len(header) < 4:
             # Hit end of stream, return terminator block
             obj.size = -1
             return obj
 
-        obj.magic = magic_bytes
-        obj.map_id = MapId.read(f)
-        obj.size = struct.unpack("<i", f.read(4))[0]
-        obj.unk0xc = struct.unpack("<I", f.read(4))[0]
+        magic, map_id, obj.size, obj.unk0xc = cls._HEADER.unpack(header)
+        obj.magic = magic
+        obj.map_id = MapId(map_id)
 
         if obj.size > 0x10:
             obj.data = f.read(obj.size - 0x10)
@@ -460,15 +485,12 @@ class WorldBlockChrData:
 
     def write(self, f: BytesIO):
         """Write WorldBlockChrData to stream"""
-        f.write(self.magic)
-        self.map_id.write(f)
-        f.write(struct.pack("<i", self.size))
-        f.write(struct.pack("<I", self.unk0xc))
+        f.write(self._HEADER.pack(self.magic, self.map_id.data, self.size, self.unk0xc))
         if self.size > 0x10:
             f.write(self.data)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorldAreaChrData:
     """World area character data (variable size with multiple blocks)"""
 
@@ -478,14 +500,13 @@ class WorldAreaChrData:
     unk0xc: int = 0
     blocks: list[WorldBlockChrData] = field(default_factory=list)
 
+    # magic, unk_0x21042700, unk0x8, unk0xc
+    _HEADER = struct.Struct("<4s3I")
+
     @classmethod
     def read(cls, f: BytesIO) -> WorldAreaChrData:
         """Read WorldAreaChrData from stream"""
-        obj = cls()
-        obj.magic = f.read(4)
-        obj.unk_0x21042700 = struct.unpack("<I", f.read(4))[0]
-        obj.unk0x8 = struct.unpack("<I", f.read(4))[0]
-        obj.unk0xc = struct.unpack("<I", f.read(4))[0]
+        obj = cls(*cls._HEADER.unpack(f.read(cls._HEADER.size)))
 
         # Read blocks until size < 1 (with safety limit)
         max_blocks = 100  # Safety limit to prevent infinite loops
@@ -499,15 +520,14 @@ class WorldAreaChrData:
 
     def write(self, f: BytesIO):
         """Write WorldAreaChrData to stream"""
-        f.write(self.magic)
-        f.write(struct.pack("<I", self.unk_0x21042700))
-        f.write(struct.pack("<I", self.unk0x8))
-        f.write(struct.pack("<I", self.unk0xc))
+        f.write(
+            self._HEADER.pack(self.magic, self.unk_0x21042700, self.unk0x8, self.unk0xc)
+        )
         for block in self.blocks:
             block.write(f)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorldArea:
     """World area (variable size)"""
 
@@ -518,7 +538,7 @@ class WorldArea:
     def read(cls, f: BytesIO) -> WorldArea:
         """Read WorldArea from stream (variable size based on size field)"""
         obj = cls()
-        obj.size = struct.unpack("<i", f.read(4))[0]
+        obj.size = I32.unpack(f.read(4))[0]
 
         # Size field indicates how many DATA bytes to read
         if obj.size > 0 and obj.size < 0x10000:
@@ -542,7 +562,7 @@ class WorldArea:
 
     def write(self, f: BytesIO):
         """Write WorldArea to stream"""
-        f.write(struct.pack("<i", self.size))
+        f.write(I32.pack(self.size))
         self.data.write(f)
 
 
@@ -551,7 +571,7 @@ class WorldArea:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class WorldGeomDataChunk:
     """World geometry data chunk (variable size)"""
 
@@ -560,27 +580,26 @@ class WorldGeomDataChunk:
     unk_0x8: int = 0
     data: bytes = b""
 
+    # map_id, size, unk_0x8
+    _HEADER = struct.Struct("<4siQ")
+
     @classmethod
     def read(cls, f: BytesIO) -> WorldGeomDataChunk:
         """Read WorldGeomDataChunk from stream"""
-        obj = cls()
-        obj.map_id = MapId.read(f)
-        obj.size = struct.unpack("<i", f.read(4))[0]
-        obj.unk_0x8 = struct.unpack("<Q", f.read(8))[0]
+        map_id, size, unk_0x8 = cls._HEADER.unpack(f.read(cls._HEADER.size))
+        obj = cls(MapId(map_id), size, unk_0x8)
         if obj.size > 0x10:
             obj.data = f.read(obj.size - 0x10)
         return obj
 
     def write(self, f: BytesIO):
         """Write WorldGeomDataChunk to stream"""
-        self.map_id.write(f)
-        f.write(struct.pack("<i", self.size))
-        f.write(struct.pack("<Q", self.unk_0x8))
+        f.write(self._HEADER.pack(self.map_id.data, self.size, self.unk_0x8))
         if self.size > 0x10:
             f.write(self.data)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorldGeomData:
     """World geometry data (variable size with multiple chunks)"""
 
@@ -588,12 +607,13 @@ class WorldGeomData:
     unk_0x4: int = 0
     chunks: list[WorldGeomDataChunk] = field(default_factory=list)
 
+    # magic, unk_0x4
+    _HEADER = struct.Struct("<4sI")
+
     @classmethod
     def read(cls, f: BytesIO) -> WorldGeomData:
         """Read WorldGeomData from stream"""
-        obj = cls()
-        obj.magic = f.read(4)
-        obj.unk_0x4 = struct.unpack("<I", f.read(4))[0]
+        obj = cls(*cls._HEADER.unpack(f.read(cls._HEADER.size)))
         # Read chunks until size < 1 (with safety limit)
         max_chunks = 50  # Safety limit to prevent infinite loops
         for _ in range(max_chunks):
@@ -606,13 +626,12 @@ class WorldGeomData:
 
     def write(self, f: BytesIO):
         """Write WorldGeomData to stream"""
-        f.write(self.magic)
-        f.write(struct.pack("<I", self.unk_0x4))
+        f.write(self._HEADER.pack(self.magic, self.unk_0x4))
         for chunk in self.chunks:
             chunk.write(f)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorldGeomMan:
     """World geometry manager (variable size)"""
 
@@ -623,7 +642,7 @@ class WorldGeomMan:
     def read(cls, f: BytesIO) -> WorldGeomMan:
         """Read WorldGeomMan from stream (variable size based on size field)"""
         obj = cls()
-        obj.size = struct.unpack("<i", f.read(4))[0]
+        obj.size = I32.unpack(f.read(4))[0]
 
         # Size field indicates how many DATA bytes to read
         if obj.size > 0 and obj.size < 0x100000:
@@ -647,7 +666,7 @@ class WorldGeomMan:
 
     def write(self, f: BytesIO):
         """Write WorldGeomMan to stream"""
-        f.write(struct.pack("<i", self.size))
+        f.write(I32.pack(self.size))
         self.data.write(f)
 
 
@@ -656,7 +675,7 @@ class WorldGeomMan:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class StageManEntry:
     """Stage manager entry (variable size based on parent size)"""
 
@@ -676,7 +695,7 @@ class StageManEntry:
             f.write(self.data)
 
 
-@dataclass
+@dataclass(slots=True)
 class StageMan:
     """Stage manager (variable size)"""
 
@@ -687,7 +706,7 @@ class StageMan:
     def read(cls, f: BytesIO, total_size: int) -> StageMan:
         """Read StageMan from stream"""
         obj = cls()
-        obj.count = struct.unpack("<i", f.read(4))[0]
+        obj.count = I32.unpack(f.read(4))[0]
 
         # CRITICAL: Validate count to prevent hanging on corrupted data
         if obj.count > 0 and obj.count < 1000:  # Reasonable count limit
@@ -704,12 +723,12 @@ class StageMan:
 
     def write(self, f: BytesIO):
         """Write StageMan to stream"""
-        f.write(struct.pack("<i", self.count))
+        f.write(I32.pack(self.count))
         for entry in self.entries:
             entry.write(f)
 
 
-@dataclass
+@dataclass(slots=True)
 class RendMan:
     """Renderer manager (variable size)"""
 
@@ -720,7 +739,7 @@ class RendMan:
     def read(cls, f: BytesIO) -> RendMan:
         """Read RendMan from stream (variable size based on size field)"""
         obj = cls()
-        obj.size = struct.unpack("<i", f.read(4))[0]
+        obj.size = I32.unpack(f.read(4))[0]
 
         # Size field indicates how many DATA bytes to read
         if obj.size > 0 and obj.size < 0x100000:
@@ -734,7 +753,7 @@ class RendMan:
 
     def write(self, f: BytesIO):
         """Write RendMan to stream"""
-        f.write(struct.pack("<i", self.size))
+        f.write(I32.pack(self.size))
         self.data.write(f)
 
 
@@ -743,7 +762,7 @@ class RendMan:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerCoordinates:
     """Player position and coordinates (0x39 = 57 bytes)"""
 
@@ -754,26 +773,46 @@ class PlayerCoordinates:
     unk_coordinates: FloatVector3 = field(default_factory=FloatVector3)
     unk_angle: FloatVector4 = field(default_factory=FloatVector4)
 
+    # coordinates, map_id, angle, game_man_0xbf0, unk_coordinates, unk_angle
+    _STRUCT = struct.Struct("<3f4s4fB3f4f")
+
     @classmethod
     def read(cls, f: BytesIO) -> PlayerCoordinates:
         """Read PlayerCoordinates from stream (57 bytes)"""
+        v = cls._STRUCT.unpack(f.read(cls._STRUCT.size))
         return cls(
-            coordinates=FloatVector3.read(f),
-            map_id=MapId.read(f),
-            angle=FloatVector4.read(f),
-            game_man_0xbf0=struct.unpack("<B", f.read(1))[0],
-            unk_coordinates=FloatVector3.read(f),
-            unk_angle=FloatVector4.read(f),
+            coordinates=FloatVector3(v[0], v[1], v[2]),
+            map_id=MapId(v[3]),
+            angle=FloatVector4(v[4], v[5], v[6], v[7]),
+            game_man_0xbf0=v[8],
+            unk_coordinates=FloatVector3(v[9], v[10], v[11]),
+            unk_angle=FloatVector4(v[12], v[13], v[14], v[15]),
         )
 
     def write(self, f: BytesIO):
         """Write PlayerCoordinates to stream (57 bytes)"""
-        self.coordinates.write(f)
-        self.map_id.write(f)
-        self.angle.write(f)
-        f.write(struct.pack("<B", self.game_man_0xbf0))
-        self.unk_coordinates.write(f)
-        self.unk_angle.write(f)
+        c, a = self.coordinates, self.angle
+        uc, ua = self.unk_coordinates, self.unk_angle
+        f.write(
+            self._STRUCT.pack(
+                c.x,
+                c.y,
+                c.z,
+                self.map_id.data,
+                a.x,
+                a.y,
+                a.z,
+                a.w,
+                self.game_man_0xbf0,
+                uc.x,
+                uc.y,
+                uc.z,
+                ua.x,
+                ua.y,
+                ua.z,
+                ua.w,
+            )
+        )
 
 
 # ============================================================================
@@ -781,24 +820,36 @@ class PlayerCoordinates:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class NetMan:
     """Network manager (0x20004 = 131,076 bytes)"""
 
     unk0x0: int = 0
-    data: bytes = field(default_factory=lambda: b"\x00" * 0x20000)
+    data: bytes | memoryview = bytes(0x20000)
 
     @classmethod
-    def read(cls, f: BytesIO) -> NetMan:
-        """Read NetMan from stream (131,076 bytes)"""
+    def read(cls, f: BytesIO, source: bytes | None = None) -> NetMan:
+        """
+        Read NetMan from stream (131,076 bytes)
+
+        Args:
+            f: BytesIO stream
+            source: The bytes backing `f`, if available. data is then a
+                read-only memoryview into it instead of a 128 KiB copy (see
+                UserDataX.read)
+        """
+        unk0x0 = U32.unpack(f.read(4))[0]
+        if source is None:
+            return cls(unk0x0=unk0x0, data=f.read(0x20000))
+        data_pos = f.tell()
+        f.seek(data_pos + 0x20000)
         return cls(
-            unk0x0=struct.unpack("<I", f.read(4))[0],
-            data=f.read(0x20000),
+            unk0x0=unk0x0, data=memoryview(source)[data_pos : data_pos + 0x20000]
         )
 
     def write(self, f: BytesIO):
         """Write NetMan to stream (131,076 bytes)"""
-        f.write(struct.pack("<I", self.unk0x0))
+        f.write(U32.pack(self.unk0x0))
         f.write(self.data)
 
 
@@ -807,7 +858,7 @@ class NetMan:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class WorldAreaWeather:
     """World area weather (0xC = 12 bytes)"""
 
@@ -816,22 +867,18 @@ class WorldAreaWeather:
     timer: int = 0
     padding: int = 0
 
+    _STRUCT = struct.Struct("<HHII")
+
     @classmethod
     def read(cls, f: BytesIO) -> WorldAreaWeather:
         """Read WorldAreaWeather from stream (12 bytes)"""
-        return cls(
-            area_id=struct.unpack("<H", f.read(2))[0],
-            weather_type=struct.unpack("<H", f.read(2))[0],
-            timer=struct.unpack("<I", f.read(4))[0],
-            padding=struct.unpack("<I", f.read(4))[0],
-        )
+        return cls(*cls._STRUCT.unpack(f.read(cls._STRUCT.size)))
 
     def write(self, f: BytesIO):
         """Write WorldAreaWeather to stream (12 bytes)"""
-        f.write(struct.pack("<H", self.area_id))
-        f.write(struct.pack("<H", self.weather_type))
-        f.write(struct.pack("<I", self.timer))
-        f.write(struct.pack("<I", self.padding))
+        f.write(
+            self._STRUCT.pack(self.area_id, self.weather_type, self.timer, self.padding)
+        )
 
     def is_corrupted(self) -> bool:
         """Check if weather is corrupted (AreaId == 0)"""
@@ -843,7 +890,7 @@ class WorldAreaWeather:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class WorldAreaTime:
     """World area time (0xC = 12 bytes)"""
 
@@ -851,20 +898,16 @@ class WorldAreaTime:
     minute: int = 0
     second: int = 0
 
+    _STRUCT = struct.Struct("<III")
+
     @classmethod
     def read(cls, f: BytesIO) -> WorldAreaTime:
         """Read WorldAreaTime from stream (12 bytes)"""
-        return cls(
-            hour=struct.unpack("<I", f.read(4))[0],
-            minute=struct.unpack("<I", f.read(4))[0],
-            second=struct.unpack("<I", f.read(4))[0],
-        )
+        return cls(*cls._STRUCT.unpack(f.read(cls._STRUCT.size)))
 
     def write(self, f: BytesIO):
         """Write WorldAreaTime to stream (12 bytes)"""
-        f.write(struct.pack("<I", self.hour))
-        f.write(struct.pack("<I", self.minute))
-        f.write(struct.pack("<I", self.second))
+        f.write(self._STRUCT.pack(self.hour, self.minute, self.second))
 
     def is_zero(self) -> bool:
         """Check if time is 00:00:00 (potentially corrupted)"""
@@ -887,7 +930,7 @@ class WorldAreaTime:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseVersion:
     """Base game version (0x10 = 16 bytes)"""
 
@@ -896,22 +939,23 @@ class BaseVersion:
     is_latest_version: int = 0
     unk0xc: int = 0
 
+    _STRUCT = struct.Struct("<IIII")
+
     @classmethod
     def read(cls, f: BytesIO) -> BaseVersion:
         """Read BaseVersion from stream (16 bytes)"""
-        return cls(
-            base_version_copy=struct.unpack("<I", f.read(4))[0],
-            base_version=struct.unpack("<I", f.read(4))[0],
-            is_latest_version=struct.unpack("<I", f.read(4))[0],
-            unk0xc=struct.unpack("<I", f.read(4))[0],
-        )
+        return cls(*cls._STRUCT.unpack(f.read(cls._STRUCT.size)))
 
     def write(self, f: BytesIO):
         """Write BaseVersion to stream (16 bytes)"""
-        f.write(struct.pack("<I", self.base_version_copy))
-        f.write(struct.pack("<I", self.base_version))
-        f.write(struct.pack("<I", self.is_latest_version))
-        f.write(struct.pack("<I", self.unk0xc))
+        f.write(
+            self._STRUCT.pack(
+                self.base_version_copy,
+                self.base_version,
+                self.is_latest_version,
+                self.unk0xc,
+            )
+        )
 
 
 # ============================================================================
@@ -919,11 +963,11 @@ class BaseVersion:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class PS5Activity:
     """PS5 activity data (0x20 = 32 bytes)"""
 
-    data: bytes = field(default_factory=lambda: b"\x00" * 0x20)
+    data: bytes = bytes(0x20)
 
     @classmethod
     def read(cls, f: BytesIO) -> PS5Activity:
@@ -935,7 +979,7 @@ class PS5Activity:
         f.write(self.data)
 
 
-@dataclass
+@dataclass(slots=True)
 class DLC:
     """
     DLC ownership/entry flags (0x32 = 50 bytes)
@@ -954,23 +998,26 @@ class DLC:
     preorder_the_ring: int = 0  # [0]
     shadow_of_erdtree: int = 0  # [1] - the main DLC flag
     preorder_ring_of_miquella: int = 0  # [2]
-    unused: bytes = field(default_factory=lambda: b"\x00" * 47)  # [3-49] must be 0
+    unused: bytes = bytes(47)  # [3-49] must be 0
+
+    # The three named flags; `unused` follows as raw bytes
+    _STRUCT = struct.Struct("<BBB")
+    _UNUSED_CLEAR = bytes(47)
 
     @classmethod
     def read(cls, f: BytesIO) -> DLC:
         """Read DLC from stream (50 bytes)"""
-        return cls(
-            preorder_the_ring=struct.unpack("<B", f.read(1))[0],
-            shadow_of_erdtree=struct.unpack("<B", f.read(1))[0],
-            preorder_ring_of_miquella=struct.unpack("<B", f.read(1))[0],
-            unused=f.read(47),
-        )
+        return cls(*cls._STRUCT.unpack(f.read(cls._STRUCT.size)), unused=f.read(47))
 
     def write(self, f: BytesIO):
         """Write DLC to stream (50 bytes)"""
-        f.write(struct.pack("<B", self.preorder_the_ring))
-        f.write(struct.pack("<B", self.shadow_of_erdtree))
-        f.write(struct.pack("<B", self.preorder_ring_of_miquella))
+        f.write(
+            self._STRUCT.pack(
+                self.preorder_the_ring,
+                self.shadow_of_erdtree,
+                self.preorder_ring_of_miquella,
+            )
+        )
         f.write(self.unused)
 
     def has_dlc_flag(self) -> bool:
@@ -1008,7 +1055,7 @@ class DLC:
         Returns:
             True if any unused flags are non-zero
         """
-        return self.unused != b"\x00" * 47
+        return self.unused != self._UNUSED_CLEAR
 
     def clear_invalid_flags(self):
         """
@@ -1016,7 +1063,7 @@ class DLC:
 
         Sets all unused bytes [3-49] to 0.
         """
-        self.unused = b"\x00" * 47
+        self.unused = self._UNUSED_CLEAR
 
 
 # ============================================================================
@@ -1024,7 +1071,7 @@ class DLC:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerGameDataHash:
     """
     Player game data hash (0x80 = 128 bytes)
@@ -1044,37 +1091,31 @@ class PlayerGameDataHash:
     equipped_armors_and_talismans: int = 0
     equipped_items: int = 0
     equipped_spells: int = 0
-    rest: bytes = field(default_factory=lambda: b"\x00" * 0x54)
+    rest: bytes = bytes(0x54)
+
+    # The eleven u32 hashes; `rest` follows as raw bytes
+    _STRUCT = struct.Struct("<11I")
 
     @classmethod
     def read(cls, f: BytesIO) -> PlayerGameDataHash:
         """Read PlayerGameDataHash from stream (128 bytes)"""
-        return cls(
-            level=struct.unpack("<I", f.read(4))[0],
-            stats=struct.unpack("<I", f.read(4))[0],
-            archetype=struct.unpack("<I", f.read(4))[0],
-            playergame_data_0xc0=struct.unpack("<I", f.read(4))[0],
-            padding=struct.unpack("<I", f.read(4))[0],
-            runes=struct.unpack("<I", f.read(4))[0],
-            runes_memory=struct.unpack("<I", f.read(4))[0],
-            equipped_weapons=struct.unpack("<I", f.read(4))[0],
-            equipped_armors_and_talismans=struct.unpack("<I", f.read(4))[0],
-            equipped_items=struct.unpack("<I", f.read(4))[0],
-            equipped_spells=struct.unpack("<I", f.read(4))[0],
-            rest=f.read(0x54),
-        )
+        return cls(*cls._STRUCT.unpack(f.read(cls._STRUCT.size)), rest=f.read(0x54))
 
     def write(self, f: BytesIO):
         """Write PlayerGameDataHash to stream (128 bytes)"""
-        f.write(struct.pack("<I", self.level))
-        f.write(struct.pack("<I", self.stats))
-        f.write(struct.pack("<I", self.archetype))
-        f.write(struct.pack("<I", self.playergame_data_0xc0))
-        f.write(struct.pack("<I", self.padding))
-        f.write(struct.pack("<I", self.runes))
-        f.write(struct.pack("<I", self.runes_memory))
-        f.write(struct.pack("<I", self.equipped_weapons))
-        f.write(struct.pack("<I", self.equipped_armors_and_talismans))
-        f.write(struct.pack("<I", self.equipped_items))
-        f.write(struct.pack("<I", self.equipped_spells))
+        f.write(
+            self._STRUCT.pack(
+                self.level,
+                self.stats,
+                self.archetype,
+                self.playergame_data_0xc0,
+                self.padding,
+                self.runes,
+                self.runes_memory,
+                self.equipped_weapons,
+                self.equipped_armors_and_talismans,
+                self.equipped_items,
+                self.equipped_spells,
+            )
+        )
         f.write(self.rest)